@@ -1,6 +1,9 @@
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from lib import vsm_api, eam_api, normalize_vsm_data, layout_diagram_algorithms, drawio_diagram_generator
+from lib import vsm_api, eam_api, normalize_vsm_data, layout_diagram_algorithms, drawio_diagram_generator, layout_cache, vsm_graph
 
 '''
 Config File Example:
@@ -19,50 +22,176 @@ config.json
   "svc_provided_api_weight": 2,
   "svc_consumed_api_weight": 1,
   "scale_factor": 40,
+  "layout_cache_dir": "layout_cache",
   "dry_run": false
 }
+
+Batch mode: replace "product_name" with a list of products, or "all" for every product in VSM.
+The VSM data is then fetched once and every diagram is generated from it.
+
+  "product_names": ["<PRODUCT NAME>", "<ANOTHER PRODUCT NAME>"],
+  "workers": 4,
+  "upload_workers": 4,
 '''
 
 def generate_and_upload_diagram(config):
     vsm_interface = vsm_api.LeanIxVsmApi(config["hostname"], config["vsm_api_token"])
     eam_interface = eam_api.LeanIxEamApi(config["hostname"], config["eam_workspace"], config["eam_api_token"])
-    normalizer = normalize_vsm_data.Normalization(config["product_name"], config["product_link_name"])
-    layout_algoriths = layout_diagram_algorithms.LayoutDiagramAlgorithms(config["svc_product_weight"], config["svc_consumed_api_weight"], config["svc_provided_api_weight"])
-    drawio_generator = drawio_diagram_generator.DrawIODiagramGenerator(config["hostname"], config["vsm_workspace"], config["scale_factor"])
-    
+
     graphql_response = vsm_interface.fetch_vsm_data(config["product_name"])
+    products = json.loads(graphql_response)["data"]["products"]
+
+    diagram_product(config, config["product_name"], products, vsm_interface, eam_interface)
+
+def generate_and_upload_diagrams(config):
+    # Authenticate and fetch once, then diagram every product from the shared data
+    vsm_interface = vsm_api.LeanIxVsmApi(config["hostname"], config["vsm_api_token"])
+    eam_interface = eam_api.LeanIxEamApi(config["hostname"], config["eam_workspace"], config["eam_api_token"])
+
+    graph = vsm_graph.VsmGraph(vsm_interface.fetch_all_vsm_data())
+
+    product_names = graph.product_names() if config["product_names"] == "all" else config["product_names"]
+
+    # Layout and XML generation are CPU-bound and run in a process pool, uploads run in a thread
+    # pool behind them, so every product is uploaded as soon as its own diagram is ready
+    workers = config.get("workers") or os.cpu_count() or 1
+    upload_workers = config.get("upload_workers", 4)
+    layout_pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else ThreadPoolExecutor(max_workers=1)
+    upload_pool = ThreadPoolExecutor(max_workers=upload_workers)
+
+    failed_products = []
+    layout_futures = {}
+    upload_futures = {}
+    with layout_pool, upload_pool:
+        for number, product_name in enumerate(product_names, start=1):
+            print(f"PRODUCT {number}/{len(product_names)}: {product_name} =====================")
+
+            products = graph.product_trees(product_name)
+            if len(products) == 0:
+                print(f"No product named '{product_name}' found in VSM")
+                failed_products.append(product_name)
+                continue
+
+            # One failing product should not stop the diagrams of all the others
+            try:
+                diagram_job = prepare_diagram(config, product_name, products, eam_interface)
+            except Exception as e:
+                print(f"Failed to diagram '{product_name}': {type(e).__name__}: {e}")
+                failed_products.append(product_name)
+                continue
+
+            if diagram_job is not None:
+                layout_futures[layout_pool.submit(layout_and_generate_diagram, config, diagram_job)] = diagram_job
+
+        for future in as_completed(layout_futures):
+            diagram_job = layout_futures[future]
+            try:
+                diagram = future.result()
+            except Exception as e:
+                print(f"Failed to diagram '{diagram_job['product_name']}': {type(e).__name__}: {e}")
+                failed_products.append(diagram_job["product_name"])
+                continue
+
+            upload_futures[upload_pool.submit(upload_diagram, config, diagram_job, diagram, vsm_interface, eam_interface)] = diagram_job
 
-    normalized_products, normalized_services, normalized_apis, normalized_data_hash, main_product_id, main_product_link_id, diagram_id = normalizer.normalize_vsm_data(graphql_response)
+        for future in as_completed(upload_futures):
+            diagram_job = upload_futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Failed to upload the diagram of '{diagram_job['product_name']}': {type(e).__name__}: {e}")
+                failed_products.append(diagram_job["product_name"])
 
-    if diagram_id is not None:
-        diagram_bookmark = eam_interface.fetch_existing_diagram(diagram_id)
+    print(f"Diagrammed {len(product_names) - len(failed_products)} of {len(product_names)} products")
+    if failed_products:
+        print(f"Failed: {', '.join(failed_products)}")
 
-        up_to_date = drawio_generator.is_existing_diagram_up_to_date(diagram_bookmark, normalized_data_hash)
+    return len(failed_products) == 0
+
+def diagram_product(config, product_name, products, vsm_interface, eam_interface):
+    diagram_job = prepare_diagram(config, product_name, products, eam_interface)
+    if diagram_job is None:
+        return
+
+    diagram = layout_and_generate_diagram(config, diagram_job)
+
+    upload_diagram(config, diagram_job, diagram, vsm_interface, eam_interface)
+
+def prepare_diagram(config, product_name, products, eam_interface):
+    normalizer = normalize_vsm_data.Normalization(product_name, config["product_link_name"])
+    drawio_generator = drawio_diagram_generator.DrawIODiagramGenerator(config["hostname"], config["vsm_workspace"], config["scale_factor"])
+
+    normalized = normalizer.normalize_products(products)
+
+    if normalized.diagram_id is not None:
+        diagram_bookmark = eam_interface.fetch_existing_diagram(normalized.diagram_id)
+
+        up_to_date = drawio_generator.is_existing_diagram_up_to_date(diagram_bookmark, normalized.data_hash)
         
         if not up_to_date:
             updated_diagram_bookmark = drawio_generator.mark_existing_diagram_outdated(diagram_bookmark)
             
-            eam_interface.update_existing_diagram(diagram_id, updated_diagram_bookmark)
+            eam_interface.update_existing_diagram(normalized.diagram_id, updated_diagram_bookmark)
 
         elif config["skip_if_latest_diagram_up_to_date"]:
             print("No need to continue since the latest diagram is up to date")
-            return
-    
-    product_positions = layout_algoriths.diagram_products(normalized_products)
-    full_graph_positions = layout_algoriths.diagram_full_graph(product_positions, normalized_products, normalized_services, normalized_apis)
+            return None
+
+    # Everything the layout and upload steps need; it is sent to a worker process in batch mode
+    return {
+        "product_name": product_name,
+        "normalized_products": normalized.products,
+        "normalized_services": normalized.services,
+        "normalized_apis": normalized.apis,
+        "normalized_data_hash": normalized.data_hash,
+        "product_service_ids": normalized.product_service_ids,
+        "main_product_id": normalized.main_product_id,
+        "main_product_link_id": normalized.main_product_link_id
+    }
 
-    drawio_diagram = drawio_generator.generate_drawio_diagram(full_graph_positions, normalized_products, normalized_services, normalized_apis, normalized_data_hash)
+def layout_and_generate_diagram(config, diagram_job):
+    layout_algoriths = layout_diagram_algorithms.LayoutDiagramAlgorithms(config["svc_product_weight"], config["svc_consumed_api_weight"], config["svc_provided_api_weight"], config.get("layout_max_iterations", 1000), config.get("layout_tolerance", 1e-3))
+    drawio_generator = drawio_diagram_generator.DrawIODiagramGenerator(config["hostname"], config["vsm_workspace"], config["scale_factor"])
+
+    product_positions = layout_algoriths.diagram_products(diagram_job["normalized_products"])
+
+    # Start from the previous layout of this product so unchanged services and APIs keep their place
+    cached_positions = None
+    if config.get("layout_cache_dir", "layout_cache") and diagram_job["main_product_id"] is not None:
+        cache = layout_cache.LayoutCache(config.get("layout_cache_dir", "layout_cache"))
+        cached_positions = cache.load(diagram_job["main_product_id"], product_positions)
+
+    full_graph_positions = layout_algoriths.diagram_full_graph(product_positions, diagram_job["normalized_products"], diagram_job["normalized_services"], diagram_job["normalized_apis"], cached_positions)
+
+    drawio_diagram = drawio_generator.generate_drawio_diagram(full_graph_positions, diagram_job["normalized_products"], diagram_job["normalized_services"], diagram_job["normalized_apis"], diagram_job["normalized_data_hash"], diagram_job["product_service_ids"])
+
+    return {
+        "drawio_diagram": drawio_diagram,
+        "product_positions": product_positions,
+        "full_graph_positions": full_graph_positions
+    }
+
+def upload_diagram(config, diagram_job, diagram, vsm_interface, eam_interface):
     time_stamp = f"{datetime.now().strftime('%m-%d %H:%M')}"
-    diagram_name = f"{config['product_name']} - {time_stamp} - VSM Product Diagram"
+    diagram_name = f"{diagram_job['product_name']} - {time_stamp} - VSM Product Diagram"
 
     if config["dry_run"] is False:
-        diagram_url = eam_interface.upload_new_diagram(drawio_diagram, diagram_name)
+        diagram_url = eam_interface.upload_new_diagram(diagram["drawio_diagram"], diagram_name)
+
+        vsm_interface.update_vsm_product(config["product_link_name"], diagram_url, diagram_job["main_product_id"], diagram_job["main_product_link_id"])
 
-        vsm_interface.update_vsm_product(config["product_link_name"], diagram_url, main_product_id, main_product_link_id)
+        if config.get("layout_cache_dir", "layout_cache") and diagram_job["main_product_id"] is not None:
+            cache = layout_cache.LayoutCache(config.get("layout_cache_dir", "layout_cache"))
+            cache.save(diagram_job["main_product_id"], diagram["product_positions"], diagram["full_graph_positions"])
 
-# Load the configuration from a JSON file
-with open("config.json") as config_file:
-    config = json.load(config_file)
+if __name__ == "__main__":
+    # Load the configuration from a JSON file
+    with open("config.json") as config_file:
+        config = json.load(config_file)
 
-# Run the main function with the loaded configuration
-generate_and_upload_diagram(config)
\ No newline at end of file
+    # Run the main function with the loaded configuration
+    if "product_names" in config:
+        if not generate_and_upload_diagrams(config):
+            sys.exit(1)
+    else:
+        generate_and_upload_diagram(config)
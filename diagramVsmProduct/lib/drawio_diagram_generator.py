@@ -281,7 +281,7 @@ class DrawIODiagramGenerator:
                     "as": "geometry"
                 })
 
-    def generate_drawio_diagram(self, full_graph_positions, products, services, apis, normalized_data_hash):
+    def generate_drawio_diagram(self, full_graph_positions, products, services, apis, normalized_data_hash, product_service_ids):
         print("Generating Diagram in XML format...")
 
         self.service_count = len(services)
@@ -292,9 +292,10 @@ class DrawIODiagramGenerator:
 
         self.graph_default_parent_and_layer(root)
 
+        # product_service_ids is the product to services index built by Normalization
         for product_id in products:
 
-            services_in_product = [services[service_id] for service_id in services if product_id in services[service_id]["product_ids"]]
+            services_in_product = [services[service_id] for service_id in product_service_ids.get(product_id, [])]
 
             product_container_id = self.graph_product_node(root, products[product_id], services_in_product, full_graph_positions)
 
@@ -302,7 +303,7 @@ class DrawIODiagramGenerator:
             self.graph_services(root, product_container_id, services_in_product, full_graph_positions)
 
         # graph the services that don't belong to any product
-        productless_services = [services[service_id] for service_id in services if len(services[service_id]["product_ids"]) == 0]
+        productless_services = [services[service_id] for service_id in product_service_ids["productless_services"]]
         self.graph_services(root, None, productless_services, full_graph_positions)
 
         # graphs all the APIs and edges between services and APIs
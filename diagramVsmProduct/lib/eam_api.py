@@ -1,6 +1,5 @@
 import json
 from . import mtm_api
-import requests
 
 class LeanIxEamApi:
     def __init__(self, hostname, workspace_name, api_token):
@@ -12,21 +11,12 @@ class LeanIxEamApi:
 
     def fetch_existing_diagram(self, diagram_id) -> str:
         url = f"{self.bookmarks_base_url}/{diagram_id}"
-        headers = {
-            "Authorization": f"Bearer {self.mtm_api.access_token}",
-            "Content-Type": "application/json"
-        }
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        response = self.mtm_api.send_request("get", url)
 
         return response.text
     
     def upload_new_diagram(self, drawio_diagram, diagram_name) -> str:
         url = self.bookmarks_base_url
-        headers = {
-            "Authorization": f"Bearer {self.mtm_api.access_token}",
-            "Content-Type": "application/json"
-        }
         body = {
             "name": diagram_name,
             "type": "VISUALIZER",
@@ -50,8 +40,7 @@ class LeanIxEamApi:
             "temporary": False,
             "oDataEnabled": False
         }
-        response = requests.post(url, headers=headers, json=body)
-        response.raise_for_status()
+        response = self.mtm_api.send_request("post", url, json=body)
 
         diagram_id = json.loads(response.text)["data"]["id"]
 
@@ -61,12 +50,7 @@ class LeanIxEamApi:
     
     def update_existing_diagram(self, diagram_id, diagram_bookmark):
         url = f"{self.bookmarks_base_url}/{diagram_id}"
-        headers = {
-            "Authorization": f"Bearer {self.mtm_api.access_token}",
-            "Content-Type": "application/json"
-        }
-        response = requests.put(url, headers=headers, json=diagram_bookmark)
-        response.raise_for_status()
+        response = self.mtm_api.send_request("put", url, json=diagram_bookmark)
 
         return response.text
         
\ No newline at end of file
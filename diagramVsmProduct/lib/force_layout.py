@@ -0,0 +1,218 @@
+import numpy as np
+
+class ForceDirectedLayout:
+    '''
+    Fruchterman-Reingold spring layout (same forces as networkx.spring_layout) with a
+    grid-approximated repulsion kernel.
+
+    Nodes are binned into a hierarchy of square grids (a quadtree stored as dense arrays).
+    Repulsion between nodes in the same or adjacent finest cells is computed exactly; farther
+    away, whole cells push as a single mass at their centroid, with coarser cells used the
+    farther they are (as in Barnes-Hut). That makes an iteration roughly O(n log n) instead
+    of O(n^2). Instead of a fixed number of iterations, the layout stops as soon as the nodes
+    have stopped moving.
+    '''
+
+    # Below this many nodes the exact O(n^2) kernel is cheaper than building the grid
+    EXACT_REPULSION_MAX_NODES = 300
+
+    def __init__(self, max_iterations=1000, tolerance=1e-3, cooling=0.98, seed=None, warm_iterations=50) -> None:
+        self.MAX_ITERATIONS = max_iterations
+        self.WARM_ITERATIONS = warm_iterations
+        self.TOLERANCE = tolerance
+        self.COOLING = cooling
+        self.random = np.random.default_rng(seed)
+        self.iterations = 0
+        self.warm_started_nodes = 0
+
+    def layout(self, graph, positions, fixed, k=None, warm_start=None):
+        # `positions` seeds (and, for the `fixed` nodes, pins) node positions. `warm_start` holds
+        # positions from a previous layout; when most free nodes have one, the layout only relaxes
+        # them for a few low-temperature iterations so unchanged nodes stay where they were.
+        nodes = list(graph.nodes)
+        node_count = len(nodes)
+        if node_count == 0:
+            return {}
+
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = [(index[u], index[v], weight) for u, v, weight in graph.edges(data="weight", default=1)]
+        sources = np.array([edge[0] for edge in edges], dtype=int)
+        targets = np.array([edge[1] for edge in edges], dtype=int)
+        weights = np.array([edge[2] for edge in edges], dtype=float)
+
+        # optimal distance between nodes, networkx's default
+        if k is None:
+            k = np.sqrt(1.0 / node_count)
+
+        fixed_mask = np.zeros(node_count, dtype=bool)
+        for node in fixed:
+            if node in index:
+                fixed_mask[index[node]] = True
+
+        warm_start = {node: position for node, position in (warm_start or {}).items()
+                      if node in index and not fixed_mask[index[node]]}
+        self.warm_started_nodes = len(warm_start)
+        pos = self.initial_positions(nodes, index, {**warm_start, **positions}, sources, targets, k)
+
+        # the temperature caps how far a node may move per iteration and cools down every iteration;
+        # after a warm start, cached nodes only settle while new nodes can still find their place
+        free_count = node_count - fixed_mask.sum()
+        if free_count > 0 and len(warm_start) >= 0.5 * free_count:
+            cached = np.zeros(node_count, dtype=bool)
+            cached[[index[node] for node in warm_start]] = True
+            temperature = np.where(cached, 0.02 * k, k)
+            max_iterations = self.WARM_ITERATIONS
+        else:
+            temperature = np.full(node_count, 0.1 * max(np.ptp(pos, axis=0).max(), k))
+            max_iterations = self.MAX_ITERATIONS
+
+        self.iterations = 0
+        for self.iterations in range(1, max_iterations + 1):
+            displacement = self.repulsion(pos, k)
+
+            # attraction along the edges, proportional to the edge weight
+            delta = pos[sources] - pos[targets]
+            distance = np.maximum(np.sqrt((delta ** 2).sum(axis=1)), 0.01)
+            attraction = delta * (weights * distance / k)[:, None]
+            for axis in range(2):
+                displacement[:, axis] += np.bincount(targets, attraction[:, axis], node_count) \
+                    - np.bincount(sources, attraction[:, axis], node_count)
+
+            displacement[fixed_mask] = 0
+            length = np.sqrt((displacement ** 2).sum(axis=1))
+            step = np.minimum(length, temperature) / np.where(length > 0, length, 1)
+            movement = displacement * step[:, None]
+            pos += movement
+
+            temperature *= self.COOLING
+            if np.sqrt((movement ** 2).sum(axis=1)).mean() < self.TOLERANCE * k:
+                break
+
+        return {node: pos[i] for i, node in enumerate(nodes)}
+
+    def initial_positions(self, nodes, index, positions, sources, targets, k):
+        node_count = len(nodes)
+        pos = np.zeros((node_count, 2))
+        known = np.zeros(node_count, dtype=bool)
+        for node, position in positions.items():
+            if node in index:
+                pos[index[node]] = position
+                known[index[node]] = True
+
+        if known.any():
+            low, high = pos[known].min(axis=0), pos[known].max(axis=0)
+        else:
+            low, high = np.zeros(2), np.ones(2)
+
+        # start new nodes next to the positioned nodes they are linked to, one hop at a time
+        while not known.all():
+            neighbour_sum = np.zeros((node_count, 2))
+            neighbour_count = np.zeros(node_count)
+            for a, b in ((sources, targets), (targets, sources)):
+                linked = known[b] & ~known[a]
+                np.add.at(neighbour_sum, a[linked], pos[b[linked]])
+                np.add.at(neighbour_count, a[linked], 1)
+
+            anchored = np.nonzero(neighbour_count > 0)[0]
+            if len(anchored) == 0:
+                break
+            pos[anchored] = neighbour_sum[anchored] / neighbour_count[anchored, None] \
+                + self.random.normal(scale=k, size=(len(anchored), 2))
+            known[anchored] = True
+
+        # nodes without any positioned neighbour start anywhere
+        unknown = np.nonzero(~known)[0]
+        pos[unknown] = self.random.uniform(low, np.maximum(high, low + k), size=(len(unknown), 2))
+
+        return pos
+
+    def repulsion(self, pos, k):
+        if len(pos) <= self.EXACT_REPULSION_MAX_NODES:
+            delta = pos[:, None, :] - pos[None, :, :]
+            distance_squared = np.maximum((delta ** 2).sum(axis=2), 1e-4)
+            return (delta * (k * k / distance_squared)[:, :, None]).sum(axis=1)
+
+        return self.grid_repulsion(pos, k)
+
+    def grid_repulsion(self, pos, k):
+        node_count = len(pos)
+
+        # the finest grid has cells about 2k wide, every coarser level halves the cells per side
+        low = pos.min(axis=0)
+        extent = max(np.ptp(pos, axis=0).max(), k) * (1 + 1e-9)
+        levels = int(np.clip(np.ceil(np.log2(extent / (2 * k))), 2, 9))
+        side = 2 ** levels
+        node_cells = np.minimum(((pos - low) / extent * side).astype(int), side - 1)
+
+        displacement = self.near_field_repulsion(pos, node_cells, side, k)
+
+        # far field: on every level, the children of the cells around a node's parent cell that are
+        # not next to the node's own cell repel as their node count at their centroid
+        cell_ids = node_cells[:, 0] * side + node_cells[:, 1]
+        mass = np.bincount(cell_ids, minlength=side * side).reshape(side, side).astype(float)
+        weighted = [np.bincount(cell_ids, pos[:, axis], side * side).reshape(side, side) for axis in range(2)]
+        offsets = np.arange(6)
+        for level in range(levels, 1, -1):
+            level_side = 2 ** level
+            cells = node_cells >> (levels - level)
+            first = ((cells >> 1) - 1) * 2
+            candidate_x = (first[:, 0, None] + offsets)[:, :, None]
+            candidate_y = (first[:, 1, None] + offsets)[:, None, :]
+            valid = (candidate_x >= 0) & (candidate_x < level_side) & (candidate_y >= 0) & (candidate_y < level_side) \
+                & ((np.abs(candidate_x - cells[:, 0, None, None]) > 1) | (np.abs(candidate_y - cells[:, 1, None, None]) > 1))
+            candidate_x = np.clip(candidate_x, 0, level_side - 1)
+            candidate_y = np.clip(candidate_y, 0, level_side - 1)
+
+            candidate_mass = np.where(valid, mass[candidate_x, candidate_y], 0)
+            safe_mass = np.maximum(candidate_mass, 1)
+            delta_x = pos[:, 0, None, None] - weighted[0][candidate_x, candidate_y] / safe_mass
+            delta_y = pos[:, 1, None, None] - weighted[1][candidate_x, candidate_y] / safe_mass
+            strength = candidate_mass * (k * k) / np.maximum(delta_x * delta_x + delta_y * delta_y, 1e-4)
+            displacement[:, 0] += (delta_x * strength).reshape(node_count, -1).sum(axis=1)
+            displacement[:, 1] += (delta_y * strength).reshape(node_count, -1).sum(axis=1)
+
+            half = level_side // 2
+            mass = mass.reshape(half, 2, half, 2).sum(axis=(1, 3))
+            weighted = [w.reshape(half, 2, half, 2).sum(axis=(1, 3)) for w in weighted]
+
+        return displacement
+
+    def near_field_repulsion(self, pos, node_cells, side, k):
+        # exact repulsion for every pair of nodes in the same or adjacent cells
+        node_count = len(pos)
+        displacement = np.zeros((node_count, 2))
+        cell_ids = node_cells[:, 0] * side + node_cells[:, 1]
+
+        order = np.argsort(cell_ids, kind="stable")
+        cells, starts, counts = np.unique(cell_ids[order], return_index=True, return_counts=True)
+        cell_x, cell_y = cells // side, cells % side
+
+        pair_rows = []
+        pair_cols = []
+        for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+            neighbour_x, neighbour_y = cell_x + dx, cell_y + dy
+            neighbour_ids = neighbour_x * side + neighbour_y
+            slots = np.minimum(np.searchsorted(cells, neighbour_ids), len(cells) - 1)
+            valid = (neighbour_x < side) & (neighbour_y >= 0) & (neighbour_y < side) & (cells[slots] == neighbour_ids)
+            a, b = np.nonzero(valid)[0], slots[valid]
+
+            pair_counts = counts[a] * counts[b]
+            block = np.repeat(np.arange(len(a)), pair_counts)
+            offset = np.arange(pair_counts.sum()) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+            rows = starts[a][block] + offset // counts[b][block]
+            cols = starts[b][block] + offset % counts[b][block]
+            if dx == 0 and dy == 0:
+                rows, cols = rows[rows < cols], cols[rows < cols]
+
+            pair_rows.append(order[rows])
+            pair_cols.append(order[cols])
+
+        rows = np.concatenate(pair_rows)
+        cols = np.concatenate(pair_cols)
+        delta = pos[rows] - pos[cols]
+        force = delta * (k * k / np.maximum((delta ** 2).sum(axis=1), 1e-4))[:, None]
+        for axis in range(2):
+            displacement[:, axis] += np.bincount(rows, force[:, axis], node_count) \
+                - np.bincount(cols, force[:, axis], node_count)
+
+        return displacement
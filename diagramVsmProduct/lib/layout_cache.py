@@ -0,0 +1,45 @@
+import json
+import math
+import os
+
+class LayoutCache:
+    def __init__(self, cache_dir) -> None:
+        self.CACHE_DIR = cache_dir
+
+    def cache_path(self, product_id):
+        return os.path.join(self.CACHE_DIR, f"{product_id}.json")
+
+    def load(self, product_id, product_positions):
+        path = self.cache_path(product_id)
+        if not os.path.exists(path):
+            print(f"No cached layout for product '{product_id}', computing a new layout")
+            return {}
+
+        with open(path) as cache_file:
+            cached = json.load(cache_file)
+
+        # Cached positions only fit if the products are still anchored at the same places
+        anchors = cached.get("anchors", {})
+        if set(anchors) != set(product_positions) or any(
+                not all(math.isclose(a, b, abs_tol=1e-9) for a, b in zip(anchors[node], product_positions[node]))
+                for node in product_positions):
+            print("The products changed since the cached layout was saved, computing a new layout")
+            return {}
+
+        print(f"Warm-starting the layout from {path}")
+        return cached["positions"]
+
+    def save(self, product_id, product_positions, full_graph_positions):
+        os.makedirs(self.CACHE_DIR, exist_ok=True)
+
+        cached = {
+            "anchors": {node: [float(ordinate) for ordinate in position] for node, position in product_positions.items()},
+            "positions": {node: [float(ordinate) for ordinate in position] for node, position in full_graph_positions.items()}
+        }
+
+        # Write to a temporary file first so an interrupted run never leaves a truncated cache behind
+        path = self.cache_path(product_id)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as cache_file:
+            json.dump(cached, cache_file)
+        os.replace(temp_path, path)
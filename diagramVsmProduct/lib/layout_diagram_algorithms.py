@@ -1,10 +1,12 @@
 import networkx as nx
+from . import force_layout
 
 class LayoutDiagramAlgorithms:
-    def __init__(self, svc_product_weight, svc_consumed_api_weight, svc_provided_api_weight) -> None:
+    def __init__(self, svc_product_weight, svc_consumed_api_weight, svc_provided_api_weight, layout_max_iterations=1000, layout_tolerance=1e-3) -> None:
         self.SVC_PRODUCT_WEIGHT = svc_product_weight
         self.SVC_CONSUMED_API_WEIGHT = svc_consumed_api_weight
         self.SVC_PROVIDED_API_WEIGHT = svc_provided_api_weight
+        self.force_layout = force_layout.ForceDirectedLayout(layout_max_iterations, layout_tolerance)
 
     def diagram_products(self, products):
 
@@ -22,7 +24,7 @@ class LayoutDiagramAlgorithms:
 
         return product_positions
 
-    def diagram_full_graph(self, product_positions, products, services, apis):
+    def diagram_full_graph(self, product_positions, products, services, apis, cached_positions=None):
         full_graph = nx.Graph()
 
         full_graph.add_node("productless_services")
@@ -49,10 +51,9 @@ class LayoutDiagramAlgorithms:
             for target_id in apis[api_id]["target_ids"]:
                 full_graph.add_edge(api_id, target_id, weight=self.SVC_PROVIDED_API_WEIGHT)
 
-        iterations = (len(services) + len(apis)) * 100
-
-        # Apply a layout algorithm
-        full_graph_positions = nx.spring_layout(full_graph, fixed=product_positions.keys(), pos=product_positions, k=None, iterations=iterations)
+        # Apply a layout algorithm, the products stay fixed where diagram_products put them
+        full_graph_positions = self.force_layout.layout(full_graph, product_positions, fixed=product_positions.keys(), warm_start=cached_positions)
+        print(f"Layout of {full_graph.number_of_nodes()} nodes ({self.force_layout.warm_started_nodes} from the cache) finished after {self.force_layout.iterations} iterations")
 
         # Print the calculated positions
         print("FULL GRAPH ==================================")
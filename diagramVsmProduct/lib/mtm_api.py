@@ -1,3 +1,5 @@
+import threading
+import time
 import requests
 
 class LeanIxMtmApi:
@@ -5,12 +7,17 @@ class LeanIxMtmApi:
         self.hostname = hostname
         self.api_token = api_token
         self.access_token = None
+        self.access_token_expires_at = None
         self.launch_url = None
+        self.TOKEN_REFRESH_MARGIN = 300
+
+        # Batch mode shares one client between the upload threads
+        self.token_lock = threading.Lock()
 
         self.authenticate()
 
     def authenticate(self):
-        
+
         url = f"https://{self.hostname}/services/mtm/v1/oauth2/token"
         auth = ("apitoken", self.api_token)
         data = {"grant_type": "client_credentials"}
@@ -18,6 +25,42 @@ class LeanIxMtmApi:
         response = requests.post(url, auth=auth, data=data)
         response.raise_for_status()
 
-        self.access_token = response.json()["access_token"]
+        token = response.json()
+        self.access_token = token["access_token"]
+        self.access_token_expires_at = time.monotonic() + token["expires_in"] if "expires_in" in token else None
+
+        return token["access_token"]
+
+    def get_access_token(self):
+        # A batch run can outlive one token, so authenticate again shortly before it expires
+        with self.token_lock:
+            if self.access_token_expires_at is not None and time.monotonic() > self.access_token_expires_at - self.TOKEN_REFRESH_MARGIN:
+                print("Access token is about to expire, authenticating again...")
+                self.authenticate()
+
+            return self.access_token
+
+    def send_request(self, method, url, **kwargs):
+        access_token = self.get_access_token()
+        response = requests.request(method, url, headers=self.auth_headers(access_token), **kwargs)
+
+        # The token can still expire or be revoked early; authenticate again once and retry
+        if response.status_code == 401:
+            with self.token_lock:
+                # Another thread may already have replaced the rejected token
+                if self.access_token == access_token:
+                    print("Access token was rejected, authenticating again...")
+                    self.authenticate()
+                access_token = self.access_token
+
+            response = requests.request(method, url, headers=self.auth_headers(access_token), **kwargs)
+
+        response.raise_for_status()
+
+        return response
 
-        return response.json()["access_token"]
+    def auth_headers(self, access_token):
+        return {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        }
@@ -1,7 +1,10 @@
 
 import hashlib
 import json
+from collections import namedtuple
 
+# Result of Normalization.normalize_products
+NormalizedVsmData = namedtuple("NormalizedVsmData", ["products", "services", "apis", "data_hash", "main_product_id", "main_product_link_id", "diagram_id", "product_service_ids"])
 
 class Normalization:
     def __init__(self, product_name, product_link_name):
@@ -11,6 +14,7 @@ class Normalization:
         self.normalized_services = {}
         self.normalized_apis = {}
         self.normalized_data_hash = None
+        self.product_service_ids = {}
         self.main_product_id = None
         self.main_product_link_id = None
         self.diagram_id = None
@@ -21,17 +25,33 @@ class Normalization:
         return sha256.hexdigest()
 
     def normalize_vsm_data(self, graphql_response):
-        print("Normalizing VSM Data...")
-
         data = json.loads(graphql_response)
-        products = data["data"]["products"]
+
+        return self.normalize_products(data["data"]["products"])
+
+    def normalize_products(self, products):
+        print("Normalizing VSM Data...")
 
         for product in products:
             self.normalize_product(product)
 
         self.normalized_data_hash = self.hash_string(str(self.normalized_products)+str(self.normalized_services)+str(self.normalized_apis))
 
-        return self.normalized_products, self.normalized_services, self.normalized_apis, self.normalized_data_hash, self.main_product_id, self.main_product_link_id, self.diagram_id
+        self.index_product_services()
+
+        return NormalizedVsmData(self.normalized_products, self.normalized_services, self.normalized_apis, self.normalized_data_hash, self.main_product_id, self.main_product_link_id, self.diagram_id, self.product_service_ids)
+
+    def index_product_services(self):
+        # Product id to the ids of its services; services without a product are listed under "productless_services", like in the layout
+        self.product_service_ids = {product_id: [] for product_id in self.normalized_products}
+        self.product_service_ids["productless_services"] = []
+
+        for service_id, service in self.normalized_services.items():
+            for product_id in dict.fromkeys(service["product_ids"]):
+                self.product_service_ids.setdefault(product_id, []).append(service_id)
+
+            if len(service["product_ids"]) == 0:
+                self.product_service_ids["productless_services"].append(service_id)
 
     def normalize_product(self, product):
         # Check if this product already exists
@@ -1,5 +1,4 @@
 from . import mtm_api
-import requests
 
 class LeanIxVsmApi:
     def __init__(self, hostname, api_token):
@@ -10,13 +9,8 @@ class LeanIxVsmApi:
     def send_vsm_graphql_request(self, query, variables=None):
 
         url = f"https://{self.hostname}/services/vsm-compass/v1/graphql"
-        headers = {
-            "Authorization": f"Bearer {self.mtm_api.access_token}",
-            "Content-Type": "application/json"
-        }
         request_json = {"query": query, **({"variables": variables} if variables is not None else {})}
-        response = requests.post(url, headers=headers, json=request_json)
-        response.raise_for_status()
+        response = self.mtm_api.send_request("post", url, json=request_json)
 
         return response.text
 
@@ -72,6 +66,60 @@ query ProductModel($productname: String) {
 
         return response
     
+    def fetch_all_vsm_data(self):
+        print("Fetching all VSM Data...")
+
+        # One flat query for every product, service and API; the relations only carry ids
+        query = '''
+query AllProductModels {
+  products {
+    id
+    name
+    links {
+      name
+      id
+      url
+    }
+    readOnlyLinksV2(where: {source: {_like: "%eam%"}}) {
+      url
+    }
+    relProductToService {
+      service {
+        id
+      }
+    }
+  }
+  services {
+    id
+    name
+    relServiceToProduct {
+      product {
+        id
+      }
+    }
+    relServiceToApi {
+      api {
+        id
+      }
+    }
+  }
+  apis {
+    id
+    name
+    relApiToService {
+      role
+      service {
+        id
+      }
+    }
+  }
+}
+    '''
+
+        response = self.send_vsm_graphql_request(query)
+
+        return response
+
     def update_vsm_product(self, product_link_name, diagram_url, product_id=None, existing_link_id=None):
         print('Updating VSM Product...')
 
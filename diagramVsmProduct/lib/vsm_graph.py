@@ -0,0 +1,77 @@
+import json
+
+class VsmGraph:
+    '''
+    The whole VSM workspace from LeanIxVsmApi.fetch_all_vsm_data, indexed once so the product
+    trees of any product can be handed to Normalization without another query.
+
+    product_trees returns the same nested structure the per-product query in fetch_vsm_data
+    returns, so the normalized data (and its hash) is the same in single and batch mode.
+    '''
+
+    def __init__(self, graphql_response) -> None:
+        data = json.loads(graphql_response)["data"]
+
+        self.products = data["products"]
+        products_by_id = {product["id"]: product for product in self.products}
+
+        # Products as they appear at the end of the per-product query
+        product_leaves = {}
+        for product in self.products:
+            product_leaves[product["id"]] = {
+                "id": product["id"],
+                "name": product["name"],
+                "readOnlyLinksV2": product["readOnlyLinksV2"]
+            }
+
+        # Services as they appear below an API, with the products they belong to
+        service_leaves = {}
+        for service in data["services"]:
+            service_leaves[service["id"]] = {
+                "id": service["id"],
+                "name": service["name"],
+                "relServiceToProduct": [{"product": product_leaves[rel["product"]["id"]]}
+                                        for rel in service["relServiceToProduct"] if rel["product"]["id"] in products_by_id]
+            }
+
+        api_nodes = {}
+        for api in data["apis"]:
+            api_nodes[api["id"]] = {
+                "id": api["id"],
+                "name": api["name"],
+                "relApiToService": [{"role": rel["role"], "service": service_leaves[rel["service"]["id"]]}
+                                    for rel in api["relApiToService"] if rel["service"]["id"] in service_leaves]
+            }
+
+        # Services as they appear directly below a product, with their APIs
+        self.service_nodes = {}
+        for service in data["services"]:
+            self.service_nodes[service["id"]] = {
+                "id": service["id"],
+                "name": service["name"],
+                "relServiceToApi": [{"api": api_nodes[rel["api"]["id"]]}
+                                    for rel in service["relServiceToApi"] if rel["api"]["id"] in api_nodes]
+            }
+
+        self.products_by_name = {}
+        for product in self.products:
+            self.products_by_name.setdefault(product["name"], []).append(product)
+
+        print(f"Indexed {len(self.products)} products, {len(data['services'])} services and {len(data['apis'])} APIs")
+
+    def product_names(self):
+        return list(self.products_by_name)
+
+    def product_trees(self, product_name):
+        product_trees = []
+        for product in self.products_by_name.get(product_name, []):
+            product_trees.append({
+                "id": product["id"],
+                "name": product["name"],
+                "links": product["links"],
+                "readOnlyLinksV2": product["readOnlyLinksV2"],
+                "relProductToService": [{"service": self.service_nodes[rel["service"]["id"]]}
+                                        for rel in product["relProductToService"] if rel["service"]["id"] in self.service_nodes]
+            })
+
+        return product_trees
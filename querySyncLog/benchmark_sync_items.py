@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for query_sync_items_with_status.py against a local mock synclog API.
+
+Runs LeanIXSyncItemsClient against an in-process stand-in for /oauth2/token and
+/synclog/v1/syncItems (an httpx MockTransport) with a synthetic dataset, configurable
+latency, page size cap and HTTP 429 injection. No LeanIX tenant is contacted.
+
+Each mode runs in its own subprocess so peak RSS is measured per mode.
+
+Usage:
+    python benchmark_sync_items.py
+    python benchmark_sync_items.py --items 200000 --latency 0.08 --concurrency 16 --modes sequential concurrent
+    python benchmark_sync_items.py --save baseline.json
+    python benchmark_sync_items.py --baseline baseline.json --tolerance 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+from typing import Optional, Dict, Any, List
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from query_sync_items_with_status import LeanIXSyncItemsClient, format_iso_datetime  # noqa: E402
+
+
+MODES = ["sequential", "streaming", "concurrent", "sharded", "by-status"]
+DATASET_END = datetime(2026, 1, 1, tzinfo=timezone.utc)
+DATASET_STEP = timedelta(seconds=30)
+
+
+def make_dataset(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Synthetic sync items, newest first, 30 seconds apart."""
+    rnd = random.Random(seed)
+    items = []
+    for i in range(count):
+        created = DATASET_END - DATASET_STEP * i
+        status = rnd.choice(LeanIXSyncItemsClient.VALID_STATUSES)
+        item = {
+            "id": f"{rnd.getrandbits(128):032x}",
+            "status": status,
+            "type": rnd.choice(["INBOUND", "OUTBOUND"]),
+            "source": rnd.choice(["ServiceNow", "Jira", "Signavio", "Integration API"]),
+            "createdAt": created.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z',
+            "startedAt": created.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            "finishedAt": (created + timedelta(seconds=rnd.randint(1, 600))).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            "workspaceId": "benchmark",
+        }
+        if status in ("ERROR", "WARNING"):
+            item["message"] = f"Fact sheet {rnd.randint(1, 99999)} could not be synchronized"
+        items.append(item)
+    return items
+
+
+class MockSyncLogServer:
+    """In-process stand-in for the MTM token and synclog endpoints."""
+
+    def __init__(self, items: List[Dict[str, Any]], latency: float = 0.05, jitter: float = 0.0,
+                 max_page_size: int = 1000, throttle_rate: float = 0.0, retry_after: int = 1, seed: int = 42):
+        self.items = items
+        self.by_status: Dict[str, List[Dict[str, Any]]] = {}
+        for item in items:
+            self.by_status.setdefault(item["status"], []).append(item)
+        self.latency = latency
+        self.jitter = jitter
+        self.max_page_size = max_page_size
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.requests = 0
+        self.token_requests = 0
+        self.throttled = 0
+        self._random = random.Random(seed)
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if request.url.path.endswith("/oauth2/token"):
+            self.token_requests += 1
+            return httpx.Response(200, json={"access_token": "benchmark-token", "expires_in": 3600})
+
+        await asyncio.sleep(self.latency + self._random.uniform(0, self.jitter))
+        if self.throttle_rate and self._random.random() < self.throttle_rate:
+            self.throttled += 1
+            return httpx.Response(429, headers={"Retry-After": str(self.retry_after)})
+
+        params = request.url.params
+        data = self.by_status.get(params["status"], []) if "status" in params else self.items
+        size = min(int(params.get("size", 30)), self.max_page_size)
+        page = int(params.get("page", 1))
+        return httpx.Response(200, json={"data": data[(page - 1) * size:page * size]})
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_mode(mode: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run one crawl mode against a fresh mock server and measure it."""
+    dataset = make_dataset(args.items, args.seed)
+    server = MockSyncLogServer(dataset, latency=args.latency, jitter=args.jitter, max_page_size=args.max_page_size,
+                               throttle_rate=args.throttle_rate, retry_after=args.retry_after, seed=args.seed)
+    start_date = DATASET_END - DATASET_STEP * args.items
+    end_date = DATASET_END
+    parallel = args.concurrency * (len(LeanIXSyncItemsClient.VALID_STATUSES) if mode == "by-status"
+                                   else args.shards if mode == "sharded" else 1)
+    max_connections = max(10, parallel)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+    items = 0
+    started = time.perf_counter()
+    try:
+        async with LeanIXSyncItemsClient("x" * 40, "benchmark", "benchmark", max_connections=max_connections,
+                                         http_client=http_client) as client:
+            if mode in ("sequential", "concurrent"):
+                concurrency = 1 if mode == "sequential" else args.concurrency
+                result = await client.get_all_sync_items(batch_limit=args.page_size, start_date=start_date,
+                                                         end_date=end_date, concurrency=concurrency)
+                items = len(result)
+            else:
+                if mode == "streaming":
+                    stream = client.stream_sync_items(batch_limit=args.page_size, start_date=start_date,
+                                                      end_date=end_date)
+                elif mode == "sharded":
+                    stream = client.stream_sync_items_sharded(batch_limit=args.page_size, start_date=start_date,
+                                                              end_date=end_date, shards=args.shards,
+                                                              concurrency=args.concurrency)
+                else:
+                    stream = client.stream_sync_items_by_status(batch_limit=args.page_size, start_date=start_date,
+                                                                end_date=end_date, concurrency=args.concurrency)
+                try:
+                    async for _ in stream:
+                        items += 1
+                finally:
+                    await stream.aclose()
+    finally:
+        await http_client.aclose()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "mode": mode,
+        "items": items,
+        "expected_items": args.items,
+        "seconds": round(elapsed, 3),
+        "items_per_sec": round(items / elapsed, 1) if elapsed else None,
+        "requests": server.requests,
+        "token_requests": server.token_requests,
+        "throttled": server.throttled,
+        "peak_rss_mb": round(peak_rss_mb(), 1) if resource else None,
+    }
+
+
+def run_mode_in_subprocess(mode: str, argv: List[str]) -> Dict[str, Any]:
+    """Run one mode in a fresh interpreter so its peak RSS is not shared with other modes."""
+    command = [sys.executable, os.path.abspath(__file__), "--run-mode", mode] + argv
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"mode {mode} failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def print_results(results: List[Dict[str, Any]], args: argparse.Namespace) -> None:
+    print("\n" + "="*80)
+    print("SYNC ITEMS THROUGHPUT BENCHMARK")
+    print(f"{args.items} items, page size {args.page_size}, latency {args.latency * 1000:g}ms, "
+          f"concurrency {args.concurrency}, shards {args.shards}, 429 rate {args.throttle_rate:g}")
+    print("="*80)
+    print(f"{'Mode':<12} {'Items':>9} {'Seconds':>9} {'Items/sec':>11} {'Requests':>9} {'429s':>6} {'Peak RSS':>10}")
+    for result in results:
+        rss = f"{result['peak_rss_mb']:.1f} MB" if result["peak_rss_mb"] is not None else "n/a"
+        flag = "" if result["items"] == result["expected_items"] else "  ⚠ incomplete"
+        print(f"{result['mode']:<12} {result['items']:>9} {result['seconds']:>9.2f} {result['items_per_sec']:>11.1f} "
+              f"{result['requests']:>9} {result['throttled']:>6} {rss:>10}{flag}")
+    print("="*80)
+
+
+def compare_to_baseline(results: List[Dict[str, Any]], baseline_path: str, tolerance: float) -> bool:
+    """Print the change against a saved run; False if any mode got slower than `tolerance` allows."""
+    with open(baseline_path) as f:
+        baseline = {result["mode"]: result for result in json.load(f)["results"]}
+
+    ok = True
+    print(f"\nCompared to {baseline_path} (tolerance {tolerance:.0%}):")
+    for result in results:
+        previous = baseline.get(result["mode"])
+        if not previous or not previous.get("items_per_sec"):
+            print(f"  {result['mode']:<12} no baseline")
+            continue
+        change = result["items_per_sec"] / previous["items_per_sec"] - 1
+        regressed = change < -tolerance
+        ok = ok and not regressed
+        print(f"  {result['mode']:<12} {change:+.1%} items/sec, requests {previous['requests']} -> {result['requests']}"
+              + ("  ✗ regression" if regressed else ""))
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark LeanIXSyncItemsClient against a local mock synclog API")
+    parser.add_argument("--items", type=int, default=20000, help="Size of the synthetic dataset (default: 20000)")
+    parser.add_argument("--page-size", type=int, default=100, help="Items requested per page (default: 100)")
+    parser.add_argument("--max-page-size", type=int, default=1000, help="Largest page the mock serves (default: 1000)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per mock request (default: 0.05)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency up to this many seconds")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with a 429 (default: 1)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Pages in flight for parallel modes (default: 8)")
+    parser.add_argument("--shards", type=int, default=4, help="Time shards for the sharded mode (default: 4)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES, help="Modes to run (default: all)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the dataset and 429 injection")
+    parser.add_argument("--save", help="Write the results as JSON, e.g. to use as a later --baseline")
+    parser.add_argument("--baseline", help="Results JSON from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed items/sec drop against --baseline before exiting with 1 (default: 0.2)")
+    parser.add_argument("--run-mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.run_mode:
+        print(json.dumps(asyncio.run(run_mode(args.run_mode, args))))
+        return
+
+    child_argv = sys.argv[1:]
+    results = []
+    for mode in args.modes:
+        print(f"⏱  Running {mode}...", file=sys.stderr)
+        results.append(run_mode_in_subprocess(mode, child_argv))
+    print_results(results, args)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"created": format_iso_datetime(datetime.now(timezone.utc)), "settings": {
+                key: value for key, value in vars(args).items() if key not in ("save", "baseline", "run_mode")
+            }, "results": results}, f, indent=2)
+        print(f"\n💾 Saved results to {args.save}")
+
+    if args.baseline and not compare_to_baseline(results, args.baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,12 +12,18 @@ Usage:
 
 import asyncio
 import argparse
+import gzip
+import heapq
 import json
 import logging
 import os
+import re
+import sqlite3
 import sys
 import time
-from typing import Optional, Dict, Any, List, AsyncIterator
+from collections import deque
+from collections.abc import MutableMapping
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
 from datetime import datetime, timezone, timedelta
 
 try:
@@ -25,6 +31,12 @@ try:
 except ImportError:
     date_parser = None
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 try:
     import httpx
 except ImportError:
@@ -35,10 +47,26 @@ try:
     import openpyxl
     from openpyxl import Workbook
     from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
     EXCEL_AVAILABLE = True
 except ImportError:
     EXCEL_AVAILABLE = False
 
+try:
+    import numpy as np
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 
 def setup_logging(debug: bool = False) -> None:
     """Configure logging to avoid sensitive data exposure."""
@@ -60,6 +88,52 @@ def format_iso_datetime(dt: datetime) -> str:
     return dt.isoformat().replace('+00:00', 'Z')
 
 
+def datetime_key(dt: datetime) -> str:
+    """Fixed-width UTC sort key of a datetime (naive values are taken as UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')
+
+
+def timestamp_key(date_str: str) -> str:
+    """Fixed-width UTC sort key of an ISO-8601 timestamp string.
+
+    Keys compare as strings in the same order as the datetimes they represent. The API's
+    own `YYYY-MM-DDTHH:MM:SS[.fff]Z` format is handled by slicing alone; anything else
+    falls back to full parsing. Raises ValueError if the string cannot be parsed.
+    """
+    if len(date_str) == 24 and date_str[-1] == 'Z' and date_str[10] == 'T' and date_str[19] == '.':
+        return date_str[:23] + '000'  # millisecond precision, by far the most common shape
+    if (len(date_str) >= 20 and date_str[-1] == 'Z' and date_str[10] == 'T' and date_str[4] == '-'
+            and date_str[13] == ':' and date_str[16] == ':' and date_str[:4].isdigit()):
+        if len(date_str) == 20:
+            return date_str[:19] + '.000000'
+        fraction = date_str[20:-1]
+        if date_str[19] == '.' and fraction.isdigit():
+            return date_str[:20] + (fraction + '000000')[:6]
+    return datetime_key(parse_iso_datetime(date_str))
+
+
+# Maps a timestamp key to one that sorts in the opposite order
+DESCENDING_KEY = str.maketrans('0123456789', '9876543210')
+
+
+def page_timestamp_keys(items: List[Dict[str, Any]]) -> List[Optional[str]]:
+    """Sort keys of every item's createdAt in one pass; None where it is missing or invalid."""
+    keys = []
+    for item in items:
+        created_at_str = item.get("createdAt")
+        if not created_at_str:
+            keys.append(None)
+            continue
+        try:
+            keys.append(timestamp_key(created_at_str))
+        except ValueError:
+            logging.warning(f"Invalid date format in item: {created_at_str}")
+            keys.append(None)
+    return keys
+
+
 def mask_sensitive_data(data: str, max_length: int = 100) -> str:
     """Mask potentially sensitive data for logging."""
     if not data:
@@ -69,20 +143,563 @@ def mask_sensitive_data(data: str, max_length: int = 100) -> str:
     return f"{data[:8]}...{data[-4:]}"
 
 
+class PaginationCheckpoint:
+    """Persist pagination progress so an interrupted export can resume where it left off.
+
+    The state file records the query, the last completed page and the newest/oldest
+    `createdAt` seen. Items from completed pages are spooled to a JSON Lines file next
+    to it, so a resumed run can return the full export without refetching those pages.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.items_path = f"{path}.items.jsonl"
+        self.state: Dict[str, Any] = {}
+        self.resumed = False
+        self._oldest_key: Tuple[Optional[str], Optional[str]] = (None, None)
+
+    @staticmethod
+    def build_query(status: Optional[str], batch_limit: int, start_date: Optional[datetime],
+                    end_date: Optional[datetime]) -> Dict[str, Any]:
+        """Describe a query so a checkpoint is only reused for the same export."""
+        return {
+            "status": status.upper() if status else None,
+            "batch_size": batch_limit,
+            "start_date": format_iso_datetime(start_date) if start_date else None,
+            "end_date": format_iso_datetime(end_date) if end_date else None,
+        }
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def load(self) -> Dict[str, Any]:
+        """Load the saved state, returning an empty dict if there is none."""
+        if not self.exists():
+            return {}
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠ Ignoring unreadable checkpoint {self.path}: {e}")
+            return {}
+
+    def begin(self, query: Dict[str, Any]) -> int:
+        """Start or resume an export for `query`; returns the first page to fetch."""
+        state = self.load()
+        if state and state.get("query") == query:
+            self.state = state
+            self.resumed = True
+            logging.info(f"↻ Resuming from checkpoint {self.path}: "
+                         f"{state['last_completed_page']} pages / {state['item_count']} items already done")
+            return state["last_completed_page"] + 1
+
+        if state:
+            logging.warning(f"⚠ Checkpoint {self.path} belongs to a different query - starting over")
+
+        self.clear()
+        self.state = {
+            "query": query,
+            "last_completed_page": 0,
+            "newest_created_at": None,
+            "oldest_created_at": None,
+            "boundary_ids": [],
+            "item_count": 0,
+        }
+        self.resumed = False
+        return 1
+
+    def iter_spooled_items(self):
+        """Yield items saved for the pages completed before the interruption."""
+        if not os.path.exists(self.items_path):
+            return
+        with open(self.items_path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def is_already_seen(self, item: Dict[str, Any], key: Optional[str]) -> bool:
+        """True for items covered by completed pages, or newer than the original run.
+
+        `key` is the timestamp_key() of the item's createdAt. New sync items push older
+        ones onto later pages between runs. Since results are sorted createdAt-desc,
+        anything newer than the oldest completed item (or equal to it with a known id) was
+        either already exported or arrived after the export began.
+        """
+        oldest = self.state.get("oldest_created_at")
+        if not oldest or key is None:
+            return False
+        if self._oldest_key[0] != oldest:
+            self._oldest_key = (oldest, timestamp_key(oldest))
+        oldest_key = self._oldest_key[1]
+        if key > oldest_key:
+            return True
+        return key == oldest_key and item.get("id") in self.state.get("boundary_ids", [])
+
+    def record_page(self, page: int, page_items: List[Dict[str, Any]],
+                    kept_items: List[Dict[str, Any]], page_keys: Optional[List[Optional[str]]] = None) -> None:
+        """Mark `page` complete; `page_items` is the raw page, `kept_items` what was exported.
+
+        `page_keys` are the page's timestamp keys if the caller already computed them.
+        """
+        if kept_items:
+            with open(self.items_path, "a") as f:
+                for item in kept_items:
+                    f.write(json.dumps(item, default=json_default) + "\n")
+
+        if page_keys is None:
+            page_keys = page_timestamp_keys(page_items)
+        timestamps = [(key, item["createdAt"], item.get("id"))
+                      for item, key in zip(page_items, page_keys) if key is not None]
+
+        if timestamps:
+            newest = max(timestamps, key=lambda t: t[0])
+            oldest = min(timestamps, key=lambda t: t[0])
+            if not self.state["newest_created_at"] or newest[0] > timestamp_key(self.state["newest_created_at"]):
+                self.state["newest_created_at"] = newest[1]
+
+            previous_oldest = self.state["oldest_created_at"]
+            boundary_ids = [t[2] for t in timestamps if t[0] == oldest[0]]
+            if previous_oldest and timestamp_key(previous_oldest) == oldest[0]:
+                boundary_ids = self.state["boundary_ids"] + boundary_ids
+            self.state["oldest_created_at"] = oldest[1]
+            self.state["boundary_ids"] = boundary_ids
+
+        self.state["last_completed_page"] = page
+        self.state["item_count"] += len(kept_items)
+
+        # Write atomically so a crash mid-write never corrupts the checkpoint
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """Remove the checkpoint and its spooled items."""
+        for path in (self.path, self.items_path, f"{self.path}.tmp"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class HighWaterMark:
+    """Newest harvested sync item per workspace/status, persisted between incremental runs.
+
+    Results are sorted createdAt-desc, so once pagination reaches an item at or below the
+    mark every remaining item has been harvested by an earlier run. Without a `path` the
+    mark only lives in memory (used by --follow).
+    """
+
+    def __init__(self, path: Optional[str], workspace_id: Optional[str], status: Optional[str] = None):
+        self.path = path
+        self.key = f"{workspace_id or 'default'}:{status.upper() if status else 'ALL'}"
+        self.created_key: Optional[str] = None
+        self.ids: List[str] = []
+        self._new_created_at: Optional[str] = None
+        self._new_created_key: Optional[str] = None
+        self._new_ids: List[str] = []
+
+        if not path:
+            return
+        mark = self._load_all().get(self.key)
+        if mark:
+            self.created_key = timestamp_key(mark["created_at"])
+            self.ids = mark.get("ids", [])
+            logging.info(f"ℹ️  Incremental mode: harvesting items newer than {mark['created_at']}")
+        else:
+            logging.info("ℹ️  Incremental mode: no previous harvest found - running a full crawl")
+
+    def _load_all(self) -> Dict[str, Any]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠ Ignoring unreadable state file {self.path}: {e}")
+            return {}
+
+    def is_harvested(self, item: Dict[str, Any], key: Optional[str]) -> bool:
+        """True if `item` (with createdAt sort key `key`) was harvested by an earlier run."""
+        if self.created_key is None or key is None:
+            return False
+        if key < self.created_key:
+            return True
+        return key == self.created_key and item.get("id") in self.ids
+
+    def observe(self, item: Dict[str, Any], key: str) -> None:
+        """Track `item` (with createdAt sort key `key`) as harvested in this run."""
+        if self._new_created_key is None or key > self._new_created_key:
+            self._new_created_key = key
+            self._new_created_at = item["createdAt"]
+            self._new_ids = [item.get("id")]
+        elif key == self._new_created_key:
+            self._new_ids.append(item.get("id"))
+
+    def save(self) -> None:
+        """Make the newest item seen so far the mark, persisting it if there is a path."""
+        if self._new_created_key is None:
+            return  # nothing new, keep the previous mark
+        ids = self._new_ids
+        if self.created_key is not None and self._new_created_key == self.created_key:
+            ids = self.ids + ids
+        self.created_key = self._new_created_key
+        self.ids = ids
+        self._new_created_key = None
+        self._new_ids = []
+        if not self.path:
+            return
+
+        marks = self._load_all()
+        marks[self.key] = {
+            "created_at": self._new_created_at,
+            "ids": ids,
+            "updated": datetime.now(timezone.utc).isoformat(),
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(marks, f, indent=2)
+        os.replace(tmp_path, self.path)
+        logging.info(f"💾 Saved high-water mark {marks[self.key]['created_at']} to {self.path}")
+
+
+class AdaptiveRateLimiter:
+    """Client-wide request gate shared by every in-flight request.
+
+    Concurrency follows AIMD (additive-increase/multiplicative-decrease): each success
+    raises the limit by about one slot per round of requests, and a 429 halves it and
+    pauses the whole pool for the Retry-After period. With `max_rate`, a token bucket also
+    caps requests per second, and the rate adapts the same way.
+    """
+    
+    def __init__(self, max_concurrency: int = 10, max_rate: Optional[float] = None,
+                 min_concurrency: int = 1, min_rate: float = 0.5):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.limit = float(max_concurrency)
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.rate = max_rate
+        self.in_flight = 0
+        self.throttle_count = 0
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._cond = asyncio.Condition()
+    
+    def _refill(self, now: float) -> None:
+        if self.rate is None:
+            return
+        self._tokens = min(max(self.rate, 1.0), self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+    
+    async def acquire(self) -> None:
+        async with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self.in_flight >= int(self.limit):
+                    delay = None  # wait for a release
+                elif self.rate is not None and self._tokens < 1:
+                    delay = (1 - self._tokens) / self.rate
+                else:
+                    if self.rate is not None:
+                        self._tokens -= 1
+                    self.in_flight += 1
+                    return
+                
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+    
+    async def release(self) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+    
+    def slot(self) -> "_LimiterSlot":
+        """`async with limiter.slot():` around a single HTTP request."""
+        return _LimiterSlot(self)
+    
+    def record_success(self) -> None:
+        """Additive increase: roughly one more slot (and request/s) per round of successes."""
+        self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+        if self.rate is not None:
+            self.rate = min(self.max_rate, self.rate + 1 / self.rate)
+    
+    def record_throttle(self, retry_after: float) -> None:
+        """Multiplicative decrease and a pool-wide pause after a 429."""
+        now = time.monotonic()
+        self.throttle_count += 1
+        self._paused_until = max(self._paused_until, now + retry_after)
+        
+        # A burst of 429s from requests already in flight counts as one congestion signal
+        if now - self._last_decrease >= retry_after:
+            self._last_decrease = now
+            self.limit = max(self.min_concurrency, self.limit / 2)
+            if self.rate is not None:
+                self.rate = max(self.min_rate, self.rate / 2)
+            logging.warning(f"Rate limited - pausing all requests for {retry_after}s, "
+                            f"concurrency limit now {int(self.limit)}")
+
+
+class _LimiterSlot:
+    def __init__(self, limiter: AdaptiveRateLimiter):
+        self.limiter = limiter
+    
+    async def __aenter__(self):
+        await self.limiter.acquire()
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.limiter.release()
+
+
+class RequestStats:
+    """Timing of every HTTP call and backoff sleep, for a summary or a Chrome trace file.
+
+    Each request records when it started waiting for a limiter slot, when it was sent and
+    when it finished, so time lost to throttling, to the server and to our own processing
+    between requests can be told apart.
+    """
+    
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.requests: List[Dict[str, Any]] = []
+        self.sleeps: List[Dict[str, Any]] = []
+    
+    def record_request(self, kind: str, queued: float, sent: float, finished: float, status: Optional[int],
+                       size: int, attempt: int, page: Optional[int] = None, cancelled: bool = False) -> None:
+        self.requests.append({"kind": kind, "queued": queued, "sent": sent, "finished": finished,
+                              "status": status, "bytes": size, "attempt": attempt, "page": page,
+                              "cancelled": cancelled})
+    
+    def record_sleep(self, reason: str, started: float, finished: float) -> None:
+        self.sleeps.append({"reason": reason, "started": started, "finished": finished})
+    
+    @staticmethod
+    def percentile(values: List[float], fraction: float) -> float:
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+    
+    def _network_time(self) -> float:
+        """Wall time during which at least one request was queued, in flight or backing off."""
+        intervals = sorted([(r["queued"], r["finished"]) for r in self.requests] +
+                           [(s["started"], s["finished"]) for s in self.sleeps])
+        total = 0.0
+        current_start, current_end = None, None
+        for start, end in intervals:
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    total += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            total += current_end - current_start
+        return total
+    
+    def summary(self) -> Dict[str, Any]:
+        wall = time.perf_counter() - self.started
+        pages = [r for r in self.requests if r["kind"] == "page"]
+        page_latencies = [r["finished"] - r["sent"] for r in pages if r["status"] == 200]
+        # Speculative pages cancelled after the end of the data are neither failures nor retries
+        completed = [r for r in self.requests if not r["cancelled"]]
+        summary = {
+            "wall_seconds": wall,
+            "requests": len(self.requests),
+            "auth_requests": sum(1 for r in self.requests if r["kind"] == "auth"),
+            "pages": sum(1 for r in pages if r["status"] == 200),
+            "retries": sum(1 for r in completed if r["attempt"] > 0),
+            "throttled": sum(1 for r in completed if r["status"] == 429),
+            "failed": sum(1 for r in completed
+                          if r["status"] is None or (r["status"] >= 400 and r["status"] != 429)),
+            "cancelled": len(self.requests) - len(completed),
+            "bytes": sum(r["bytes"] for r in self.requests),
+            "request_seconds": sum(r["finished"] - r["sent"] for r in self.requests),
+            "slot_wait_seconds": sum(r["sent"] - r["queued"] for r in self.requests),
+            "backoff_seconds": sum(s["finished"] - s["started"] for s in self.sleeps),
+            "processing_seconds": wall - self._network_time(),
+        }
+        if page_latencies:
+            summary.update({
+                "page_p50_seconds": self.percentile(page_latencies, 0.50),
+                "page_p95_seconds": self.percentile(page_latencies, 0.95),
+                "page_p99_seconds": self.percentile(page_latencies, 0.99),
+                "page_max_seconds": max(page_latencies),
+            })
+        return summary
+    
+    def print_summary(self) -> None:
+        if not self.requests:
+            return
+        summary = self.summary()
+        wall = summary["wall_seconds"]
+        print("\n" + "="*80)
+        print("REQUEST TIMING")
+        print("="*80)
+        print(f"Wall time: {wall:.2f}s, {summary['requests']} requests ({summary['auth_requests']} auth, "
+              f"{summary['pages']} pages), {summary['bytes'] / 1024 / 1024:.1f} MB received")
+        if summary["pages"]:
+            print(f"Pages/sec: {summary['pages'] / wall:.1f}")
+            print(f"Page latency: p50 {summary['page_p50_seconds'] * 1000:.0f}ms, "
+                  f"p95 {summary['page_p95_seconds'] * 1000:.0f}ms, p99 {summary['page_p99_seconds'] * 1000:.0f}ms, "
+                  f"max {summary['page_max_seconds'] * 1000:.0f}ms")
+        print(f"Retries: {summary['retries']} ({summary['throttled']} rate limited, {summary['failed']} other failures)")
+        if summary["cancelled"]:
+            print(f"Cancelled: {summary['cancelled']} prefetched requests past the end of the data")
+        print(f"Time in requests (summed): {summary['request_seconds']:.2f}s")
+        print(f"Waiting for a request slot (concurrency/rate limit, 429 pauses): {summary['slot_wait_seconds']:.2f}s summed")
+        print(f"Backoff sleeps: {summary['backoff_seconds']:.2f}s")
+        print(f"No request in flight (local processing, output writing): {summary['processing_seconds']:.2f}s "
+              f"of {wall:.2f}s wall time")
+        print("="*80)
+    
+    def write_trace(self, path: str) -> None:
+        """Write a Chrome trace (chrome://tracing, ui.perfetto.dev) with one lane per concurrent request."""
+        spans = [(r["queued"], r["finished"], r) for r in self.requests] + \
+                [(s["started"], s["finished"], s) for s in self.sleeps]
+        lane_ends: List[float] = []
+        events = []
+        
+        def us(t: float) -> float:
+            return round((t - self.started) * 1e6, 1)
+        
+        for start, end, record in sorted(spans, key=lambda span: span[0]):
+            lane = next((i for i, lane_end in enumerate(lane_ends) if lane_end <= start), len(lane_ends))
+            if lane == len(lane_ends):
+                lane_ends.append(end)
+            lane_ends[lane] = end
+            
+            if "reason" in record:
+                events.append({"name": f"backoff ({record['reason']})", "cat": "backoff", "ph": "X",
+                               "ts": us(start), "dur": us(end) - us(start), "pid": 1, "tid": lane})
+                continue
+            name = record["kind"] if record["page"] is None else f"page {record['page']}"
+            if record["sent"] > record["queued"]:
+                events.append({"name": f"wait: {name}", "cat": "wait", "ph": "X", "ts": us(record["queued"]),
+                               "dur": us(record["sent"]) - us(record["queued"]), "pid": 1, "tid": lane})
+            events.append({"name": name, "cat": record["kind"], "ph": "X", "ts": us(record["sent"]),
+                           "dur": us(record["finished"]) - us(record["sent"]), "pid": 1, "tid": lane,
+                           "args": {"status": record["status"], "bytes": record["bytes"],
+                                    "attempt": record["attempt"], "cancelled": record["cancelled"]}})
+        
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms", "otherData": self.summary()}, f)
+        print(f"\n🧭 Wrote request trace to {path} (open in chrome://tracing or ui.perfetto.dev)")
+
+
+_MISSING = object()
+
+
+class SyncItemRecord(MutableMapping):
+    """Compact, dict-like sync item that keeps only the fields selected with --fields.
+
+    Use `SyncItemRecord.for_fields([...])` to get a record class for those fields. Each
+    record holds its values in a single tuple ordered like `FIELDS`, so field names never
+    clash with attributes or mapping methods; fields missing from an item are absent
+    from the mapping.
+    """
+    __slots__ = ("_values",)
+    FIELDS: Tuple[str, ...] = ()
+    _INDEX: Dict[str, int] = {}
+    
+    def __init__(self):
+        self._values = (_MISSING,) * len(self.FIELDS)
+    
+    @classmethod
+    def for_fields(cls, fields: List[str]) -> type:
+        invalid = [field for field in fields if not field.isidentifier()]
+        if invalid:
+            raise ValueError(f"Only top-level field names can be projected: {', '.join(invalid)}")
+        fields = tuple(dict.fromkeys(fields))
+        return type(cls.__name__, (cls,), {"__slots__": (), "FIELDS": fields,
+                                           "_INDEX": {field: i for i, field in enumerate(fields)}})
+    
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> "SyncItemRecord":
+        record = cls.__new__(cls)
+        record._values = tuple([item.get(field, _MISSING) for field in cls.FIELDS])
+        return record
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._INDEX.get(key)
+        if i is None or self._values[i] is _MISSING:
+            return default
+        return self._values[i]
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        i = self._INDEX.get(key)
+        if i is None:
+            raise KeyError(f"{key} is not one of the projected fields ({', '.join(self.FIELDS)})")
+        self._values = self._values[:i] + (value,) + self._values[i + 1:]
+    
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        i = self._INDEX[key]
+        self._values = self._values[:i] + (_MISSING,) + self._values[i + 1:]
+    
+    def __contains__(self, key: object) -> bool:
+        i = self._INDEX.get(key)
+        return i is not None and self._values[i] is not _MISSING
+    
+    def __iter__(self):
+        return (field for field, value in zip(self.FIELDS, self._values) if value is not _MISSING)
+    
+    def __len__(self) -> int:
+        return sum(1 for value in self._values if value is not _MISSING)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+def json_default(value: Any) -> Any:
+    """`default=` hook so json.dump can write SyncItemRecord items."""
+    if isinstance(value, SyncItemRecord):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 class LeanIXSyncItemsClient:
     """Client for querying LeanIX Synchronization Items with status filtering."""
     
     VALID_STATUSES = ["OK", "WARNING", "ERROR", "INFO"]
     
-    def __init__(self, api_token: str, region: str, workspace_id: Optional[str] = None):
+    # Refresh the bearer token in the background this many seconds before it expires
+    TOKEN_REFRESH_MARGIN = 300
+    
+    def __init__(self, api_token: str, region: str, workspace_id: Optional[str] = None,
+                 max_connections: int = 10, max_rate: Optional[float] = None,
+                 http_client: Optional[httpx.AsyncClient] = None, stats: Optional[RequestStats] = None,
+                 fields: Optional[List[str]] = None):
+        """`http_client` lets several clients share one connection pool; it is not closed on exit.
+        Request timings are recorded in `stats`, which can also be shared between clients.
+        With `fields`, page items are returned as compact SyncItemRecords holding only those keys.
+        """
         self.api_token = api_token
         self.region = region
         self.workspace_id = workspace_id
+        self.max_connections = max_connections
+        self.max_rate = max_rate
+        self.limiter: Optional[AdaptiveRateLimiter] = None
         self.auth_url = f"https://{region}.leanix.net/services/mtm/v1/oauth2/token"
         self.base_url = f"https://{region}.leanix.net/services/synclog/v1"
         self.bearer_token: Optional[str] = None
         self.token_expires_at: Optional[float] = None
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = http_client
+        self._owns_client = http_client is None
+        self.stats = stats or RequestStats()
+        self.record_type = SyncItemRecord.for_fields(fields) if fields else None
+        self._token_task: Optional[asyncio.Task] = None
+        self._token_refresher: Optional[asyncio.Task] = None
         
         # Log initialization with masked token
         masked_token = mask_sensitive_data(api_token)
@@ -90,23 +707,64 @@ class LeanIXSyncItemsClient:
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(60.0),
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-        )
+        self.limiter = AdaptiveRateLimiter(max_concurrency=self.max_connections, max_rate=self.max_rate)
+        if self._owns_client:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0),
+                limits=httpx.Limits(max_keepalive_connections=max(5, self.max_connections // 2),
+                                    max_connections=self.max_connections),
+            )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._client:
+        for task in (self._token_refresher, self._token_task):
+            if task and not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        if self._client and self._owns_client:
             await self._client.aclose()
             
     async def get_bearer_token(self) -> str:
-        """Exchange API token for Bearer token with retry logic."""
+        """Return a valid Bearer token, sharing a single in-flight refresh between callers.
+
+        Concurrent callers near expiry all await the same token request instead of each
+        POSTing to /oauth2/token. After the first token, a background task renews it
+        TOKEN_REFRESH_MARGIN seconds before it expires.
+        """
         if self.bearer_token and self.token_expires_at:
             if time.time() < self.token_expires_at - 60:
                 return self.bearer_token
         
+        token = await self._refresh_bearer_token()
+        
+        if self._token_refresher is None or self._token_refresher.done():
+            self._token_refresher = asyncio.ensure_future(self._refresh_token_before_expiry())
+        
+        return token
+    
+    async def _refresh_bearer_token(self) -> str:
+        """Start a token request unless one is already in flight, and wait for it."""
+        if self._token_task is None or self._token_task.done():
+            self._token_task = asyncio.ensure_future(self._fetch_bearer_token())
+        # Shield the shared request so one cancelled waiter does not cancel it for the others
+        return await asyncio.shield(self._token_task)
+    
+    async def _refresh_token_before_expiry(self) -> None:
+        """Keep the token fresh so requests never stall on an expired token."""
+        while True:
+            margin = min(self.TOKEN_REFRESH_MARGIN, (self.token_expires_at - time.time()) / 2)
+            delay = self.token_expires_at - margin - time.time()
+            await asyncio.sleep(max(delay, 5))
+            try:
+                logging.debug("Refreshing Bearer token before expiry")
+                await self._refresh_bearer_token()
+            except Exception as e:
+                # Requests fall back to refreshing on demand if this keeps failing
+                logging.warning(f"Background token refresh failed: {type(e).__name__}")
+    
+    async def _fetch_bearer_token(self) -> str:
+        """Exchange API token for Bearer token with retry logic."""
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         data = {"grant_type": "client_credentials"}
         auth = ("apitoken", self.api_token)
@@ -115,8 +773,10 @@ class LeanIXSyncItemsClient:
         for attempt in range(max_retries):
             try:
                 logging.info(f"🔐 Authenticating with LeanIX ({self.region})... (attempt {attempt + 1})")
-                response = await self._client.post(self.auth_url, headers=headers, data=data, auth=auth)
+                response = await self._send("auth", "POST", self.auth_url, attempt,
+                                            headers=headers, data=data, auth=auth)
                 response.raise_for_status()
+                self.limiter.record_success()
                 
                 token_data = response.json()
                 self.bearer_token = token_data.get("access_token")
@@ -133,13 +793,14 @@ class LeanIXSyncItemsClient:
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:  # Rate limited
                     retry_after = int(e.response.headers.get("Retry-After", 2 ** attempt))
-                    logging.warning(f"Rate limited, waiting {retry_after}s before retry {attempt+1}/{max_retries}")
-                    await asyncio.sleep(retry_after)
+                    logging.info(f"Rate limited, retrying after {retry_after}s ({attempt+1}/{max_retries})")
+                    # Pauses and shrinks the whole pool; the retry waits for its slot
+                    self.limiter.record_throttle(retry_after)
                     continue
                 elif e.response.status_code in [500, 502, 503, 504] and attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     logging.warning(f"Server error {e.response.status_code}, retrying in {wait_time}s")
-                    await asyncio.sleep(wait_time)
+                    await self._backoff(wait_time, f"HTTP {e.response.status_code}")
                     continue
                 else:
                     logging.error(f"✗ Authentication failed: {e.response.status_code}")
@@ -153,7 +814,7 @@ class LeanIXSyncItemsClient:
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     logging.warning(f"Connection error, retrying in {wait_time}s: {type(e).__name__}")
-                    await asyncio.sleep(wait_time)
+                    await self._backoff(wait_time, type(e).__name__)
                     continue
                 else:
                     logging.error(f"✗ Authentication connection error: {e}")
@@ -164,6 +825,35 @@ class LeanIXSyncItemsClient:
         
         raise RuntimeError("Failed to authenticate after all retries")
     
+    async def _send(self, kind: str, method: str, url: str, attempt: int, page: Optional[int] = None,
+                    **kwargs) -> httpx.Response:
+        """Send one request through the rate limiter, recording its timing in `stats`."""
+        queued = time.perf_counter()
+        sent = None
+        response = None
+        cancelled = False
+        try:
+            async with self.limiter.slot():
+                sent = time.perf_counter()
+                response = await self._client.request(method, url, **kwargs)
+            return response
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            finished = time.perf_counter()
+            self.stats.record_request(kind, queued, sent or finished, finished,
+                                      response.status_code if response is not None else None,
+                                      len(response.content) if response is not None else 0, attempt, page,
+                                      cancelled=cancelled)
+    
+    async def _backoff(self, seconds: float, reason: str) -> None:
+        started = time.perf_counter()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.stats.record_sleep(reason, started, time.perf_counter())
+    
     async def query_sync_items(self, status: Optional[str] = None, limit: Optional[int] = None, 
                                cursor: Optional[str] = None, page: int = 1) -> Dict[str, Any]:
         """Query the /syncItems endpoint with optional status filter."""
@@ -212,10 +902,16 @@ class LeanIXSyncItemsClient:
                 if params:
                     logging.debug(f"   Parameters: {json.dumps(params, indent=2)}")
                 
-                response = await self._client.get(url, headers=headers, params=params)
+                response = await self._send("page", "GET", url, attempt, page=page,
+                                            headers=headers, params=params)
                 response.raise_for_status()
+                self.limiter.record_success()
                 
-                data = response.json()
+                data = json_loads(response.content)
+                if self.record_type is not None:
+                    # Drop the full dicts right away; only the projected fields stay in memory
+                    from_item = self.record_type.from_item
+                    data["data"] = [from_item(item) for item in data.get("data", [])]
                 logging.info(f"✓ Successfully retrieved sync items (page size: {len(data.get('data', []))})")
                 
                 return data
@@ -223,13 +919,14 @@ class LeanIXSyncItemsClient:
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:  # Rate limited
                     retry_after = int(e.response.headers.get("Retry-After", 2 ** attempt))
-                    logging.warning(f"Rate limited, waiting {retry_after}s before retry {attempt+1}/{max_retries}")
-                    await asyncio.sleep(retry_after)
+                    logging.info(f"Rate limited, retrying after {retry_after}s ({attempt+1}/{max_retries})")
+                    # Pauses and shrinks the whole pool; the retry waits for its slot
+                    self.limiter.record_throttle(retry_after)
                     continue
                 elif e.response.status_code in [500, 502, 503, 504] and attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     logging.warning(f"Server error {e.response.status_code}, retrying in {wait_time}s")
-                    await asyncio.sleep(wait_time)
+                    await self._backoff(wait_time, f"HTTP {e.response.status_code}")
                     continue
                 else:
                     logging.error(f"✗ Request failed: {e.response.status_code}")
@@ -243,7 +940,7 @@ class LeanIXSyncItemsClient:
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     logging.warning(f"Connection error, retrying in {wait_time}s: {type(e).__name__}")
-                    await asyncio.sleep(wait_time)
+                    await self._backoff(wait_time, type(e).__name__)
                     continue
                 else:
                     logging.error(f"✗ Request connection error: {e}")
@@ -254,167 +951,846 @@ class LeanIXSyncItemsClient:
         
         raise RuntimeError("Failed to complete request after all retries")
     
+    async def iter_pages(self, status: Optional[str] = None, batch_limit: int = 30,
+                         start_page: int = 1, concurrency: int = 1) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Yield (page, items) in page order, keeping up to `concurrency` page requests in flight.
+
+        Pages past the end of the result set may be requested speculatively; they are
+        cancelled (or discarded) as soon as a short page marks the end of the data.
+        """
+        concurrency = max(1, concurrency)
+        pending = deque()
+        next_page = start_page
+        
+        try:
+            while True:
+                # Keep the window of in-flight pages full
+                while len(pending) < concurrency:
+                    task = asyncio.ensure_future(
+                        self.query_sync_items(status=status, limit=batch_limit, page=next_page)
+                    )
+                    pending.append((next_page, task))
+                    next_page += 1
+                
+                page, task = pending.popleft()
+                response = await task
+                items = response.get("data", [])
+                
+                yield page, items
+                
+                # Fewer items than requested (or none) marks the last page
+                if len(items) < batch_limit:
+                    break
+        finally:
+            for _, task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+    
     async def get_all_sync_items(self, status: Optional[str] = None, batch_limit: int = 30,
                                  max_items: Optional[int] = None, start_date: Optional[datetime] = None,
-                                 end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
-        """Get all sync items with automatic pagination and optional client-side date filtering."""
+                                 end_date: Optional[datetime] = None, concurrency: int = 1,
+                                 checkpoint: Optional[PaginationCheckpoint] = None,
+                                 high_water_mark: Optional[HighWaterMark] = None,
+                                 seek: bool = True) -> List[Dict[str, Any]]:
+        """Get all sync items with automatic pagination and optional client-side date filtering.
+
+        With a `checkpoint`, each completed page is recorded so an interrupted run resumes
+        from the next page instead of starting again from page 1. With a `high_water_mark`,
+        pagination stops at the first item harvested by an earlier run. With `seek`, an
+        `end_date` in the past is located by bisection instead of downloading newer pages.
+        """
         all_items = []
-        page = 1
+        start_page = 1
+        start_key = datetime_key(start_date) if start_date else None
+        end_key = datetime_key(end_date) if end_date else None
         
-        while True:
-            logging.info(f"\n📄 Fetching page {page}...")
-            
-            response = await self.query_sync_items(status=status, limit=batch_limit, page=page)
-            
-            items = response.get("data", [])
-            if not items:
-                logging.info("   No more items found")
-                break
-            
-            # Filter items by date range if specified
-            filtered_items = []
-            items_before_range = 0
-            items_after_range = 0
-            
-            for item in items:
-                created_at_str = item.get("createdAt", "")
-                if not created_at_str:
-                    continue
+        if checkpoint:
+            start_page = checkpoint.begin(PaginationCheckpoint.build_query(status, batch_limit, start_date, end_date))
+            all_items.extend(checkpoint.iter_spooled_items())
+        
+        if seek and start_page == 1:
+            start_page = await self.find_start_page(status, batch_limit, end_date)
+        
+        pages = self.iter_pages(status=status, batch_limit=batch_limit, start_page=start_page,
+                                concurrency=concurrency)
+        try:
+            async for page, items in pages:
+                logging.info(f"\n📄 Fetched page {page}...")
                 
-                try:
-                    created_at = parse_iso_datetime(created_at_str)
+                if not items:
+                    logging.info("   No more items found")
+                    break
+                
+                # Filter items by date range if specified
+                filtered_items = []
+                items_before_range = 0
+                items_after_range = 0
+                reached_harvested = False
+                
+                keys = page_timestamp_keys(items)
+                for item, key in zip(items, keys):
+                    if checkpoint and checkpoint.resumed and checkpoint.is_already_seen(item, key):
+                        continue
                     
-                    # Proper datetime comparison
-                    if start_date and created_at < start_date:
+                    # Everything from here on is older, so it was harvested by an earlier run
+                    if high_water_mark and high_water_mark.is_harvested(item, key):
+                        reached_harvested = True
+                        break
+                    
+                    if key is None:
+                        continue
+                    
+                    # Fixed-width keys compare like the datetimes they encode
+                    if start_key and key < start_key:
                         items_before_range += 1
                         continue
-                    if end_date and created_at > end_date:
+                    if end_key and key > end_key:
                         items_after_range += 1
                         continue
                     
                     filtered_items.append(item)
-                except ValueError:
-                    logging.warning(f"Invalid date format in item: {created_at_str}")
-                    continue
-            
-            # If all items are before start_date, we can stop (assumes items are sorted newest first)
-            if start_date and items_before_range == len(items):
-                logging.info(f"   All {len(items)} items are before start date - stopping pagination")
-                break
-            
-            all_items.extend(filtered_items)
-            logging.info(f"   Retrieved {len(items)} items, {len(filtered_items)} match date range (total: {len(all_items)})")
-            
-            if max_items and len(all_items) >= max_items:
-                all_items = all_items[:max_items]
-                logging.info(f"   Reached maximum of {max_items} items")
-                break
-            
-            # Check if we got fewer items than requested, indicating last page
-            if len(items) < batch_limit:
-                logging.info("   Reached last page (fewer items than batch size)")
-                break
-            
-            page += 1
-            
-            if page > 100:
-                logging.warning("   Reached safety limit of 100 pages")
-                break
+                    if high_water_mark:
+                        high_water_mark.observe(item, key)
+                
+                # If all items are before start_date, we can stop (assumes items are sorted newest first)
+                if start_date and items_before_range == len(items):
+                    logging.info(f"   All {len(items)} items are before start date - stopping pagination")
+                    break
+                
+                all_items.extend(filtered_items)
+                logging.info(f"   Retrieved {len(items)} items, {len(filtered_items)} match date range (total: {len(all_items)})")
+                
+                if checkpoint:
+                    checkpoint.record_page(page, items, filtered_items, keys)
+                
+                if reached_harvested:
+                    logging.info("   Reached items harvested by a previous run - stopping pagination")
+                    break
+                
+                if max_items and len(all_items) >= max_items:
+                    all_items = all_items[:max_items]
+                    logging.info(f"   Reached maximum of {max_items} items")
+                    break
+                
+                # Check if we got fewer items than requested, indicating last page
+                if len(items) < batch_limit:
+                    logging.info("   Reached last page (fewer items than batch size)")
+                    break
+        finally:
+            await pages.aclose()
         
         return all_items
 
     async def stream_sync_items(self, status: Optional[str] = None, batch_limit: int = 30,
                                 start_date: Optional[datetime] = None,
-                                end_date: Optional[datetime] = None) -> AsyncIterator[Dict[str, Any]]:
-        """Stream sync items to avoid loading all in memory."""
-        page = 1
+                                end_date: Optional[datetime] = None,
+                                concurrency: int = 1,
+                                checkpoint: Optional[PaginationCheckpoint] = None,
+                                high_water_mark: Optional[HighWaterMark] = None,
+                                seek: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """Stream sync items to avoid loading all in memory.
+
+        With a `checkpoint`, items from previously completed pages are replayed from the
+        spool first and pagination continues after the last completed page. With a
+        `high_water_mark`, pagination stops at the first item harvested by an earlier run.
+        With `seek`, an `end_date` in the past is located by bisection instead of
+        downloading newer pages.
+        """
+        start_page = 1
+        start_key = datetime_key(start_date) if start_date else None
+        end_key = datetime_key(end_date) if end_date else None
         
-        while True:
-            logging.info(f"\n📄 Streaming page {page}...")
-            
-            response = await self.query_sync_items(status=status, limit=batch_limit, page=page)
-            
-            items = response.get("data", [])
-            if not items:
-                break
-            
-            items_yielded = 0
-            for item in items:
-                created_at_str = item.get("createdAt", "")
-                if not created_at_str:
-                    continue
+        if checkpoint:
+            start_page = checkpoint.begin(PaginationCheckpoint.build_query(status, batch_limit, start_date, end_date))
+            for item in checkpoint.iter_spooled_items():
+                yield item
+        
+        if seek and start_page == 1:
+            start_page = await self.find_start_page(status, batch_limit, end_date)
+        
+        pages = self.iter_pages(status=status, batch_limit=batch_limit, start_page=start_page,
+                                concurrency=concurrency)
+        try:
+            async for page, items in pages:
+                logging.info(f"\n📄 Streaming page {page}...")
                 
-                try:
-                    created_at = parse_iso_datetime(created_at_str)
+                if not items:
+                    break
+                
+                items_yielded = 0
+                items_before_range = 0
+                yielded_items = [] if checkpoint else None
+                reached_harvested = False
+                keys = page_timestamp_keys(items)
+                for item, key in zip(items, keys):
+                    if checkpoint and checkpoint.resumed and checkpoint.is_already_seen(item, key):
+                        continue
+                    
+                    # Everything from here on is older, so it was harvested by an earlier run
+                    if high_water_mark and high_water_mark.is_harvested(item, key):
+                        reached_harvested = True
+                        break
                     
-                    if start_date and created_at < start_date:
+                    if key is None:
                         continue
-                    if end_date and created_at > end_date:
+                    
+                    if start_key and key < start_key:
+                        items_before_range += 1
+                        continue
+                    if end_key and key > end_key:
                         continue
                     
+                    if high_water_mark:
+                        high_water_mark.observe(item, key)
                     yield item
                     items_yielded += 1
-                except ValueError:
-                    logging.warning(f"Invalid date format in item: {created_at_str}")
-                    continue
+                    if checkpoint:
+                        yielded_items.append(item)
+                
+                logging.info(f"   Processed {len(items)} items, yielded {items_yielded}")
+                
+                # Only record the page once the consumer has taken every item from it
+                if checkpoint:
+                    checkpoint.record_page(page, items, yielded_items, keys)
+                
+                if reached_harvested:
+                    logging.info("   Reached items harvested by a previous run - stopping pagination")
+                    break
+                
+                # If all items are before start_date, we can stop (assumes items are sorted newest first)
+                if start_date and items_before_range == len(items):
+                    logging.info(f"   All {len(items)} items are before start date - stopping pagination")
+                    break
+                
+                # Check if we got fewer items than requested, indicating last page
+                if len(items) < batch_limit:
+                    logging.info("   Reached last page (fewer items than batch size)")
+                    break
+        finally:
+            await pages.aclose()
+
+    async def follow_sync_items(self, high_water_mark: HighWaterMark, status: Optional[str] = None,
+                                batch_limit: int = 30, interval: float = 30.0,
+                                start_date: Optional[datetime] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Poll for new sync items forever, yielding each poll's new items oldest first.
+
+        Every poll reads page 1 and keeps paginating only while the whole page is newer
+        than `high_water_mark`, so a quiet log costs one request per `interval`. Without a
+        mark or `start_date` the first poll only establishes the mark. Failed polls are
+        logged and retried at the next interval; the client and its token stay open.
+        """
+        start_key = datetime_key(start_date) if start_date else None
+        baseline = high_water_mark.created_key is None and start_key is None
+        
+        while True:
+            new_items = []
+            page = 1
+            try:
+                while True:
+                    response = await self.query_sync_items(status=status, limit=batch_limit, page=page)
+                    items = response.get("data", [])
+                    reached_mark = False
+                    for item, key in zip(items, page_timestamp_keys(items)):
+                        if key is None:
+                            continue
+                        if high_water_mark.is_harvested(item, key) or (start_key and key < start_key):
+                            reached_mark = True
+                            break
+                        new_items.append((item, key))
+                    if reached_mark or baseline or len(items) < batch_limit:
+                        break
+                    page += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Includes the RuntimeError of sustained 429s; a long-running tail outlasts throttling
+                logging.warning(f"⚠ Poll failed, retrying in {interval:g}s: {type(e).__name__}: {e}")
+                await asyncio.sleep(interval)
+                continue
             
-            logging.info(f"   Processed {len(items)} items, yielded {items_yielded}")
+            if baseline:
+                for item, key in new_items:
+                    high_water_mark.observe(item, key)
+                high_water_mark.save()
+                baseline = False
+                logging.info(f"👀 Following new sync items (polling every {interval:g}s)...")
+            else:
+                for item, key in new_items:
+                    high_water_mark.observe(item, key)
+                if new_items:
+                    logging.info(f"   {len(new_items)} new items")
+                    # Pages are newest first; emit in the order the items were created
+                    yield [item for item, _ in reversed(new_items)]
+                high_water_mark.save()
             
-            # Check if we got fewer items than requested, indicating last page
-            if len(items) < batch_limit:
-                logging.info("   Reached last page (fewer items than batch size)")
-                break
+            await asyncio.sleep(interval)
+
+    async def stream_sync_items_by_status(self, batch_limit: int = 30, start_date: Optional[datetime] = None,
+                                          end_date: Optional[datetime] = None, concurrency: int = 1,
+                                          seek: bool = True,
+                                          buffer_size: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Run one paginated stream per status concurrently and merge them newest first.
+
+        Each status stream fills a bounded buffer in the background; a heap keyed on
+        createdAt picks the newest head item, so the output keeps the createdAt-desc order
+        of an unfiltered crawl. Items with a status outside VALID_STATUSES are not returned.
+        """
+        buffer_size = buffer_size or batch_limit * 2
+        queues = [asyncio.Queue(maxsize=buffer_size) for _ in self.VALID_STATUSES]
+        
+        async def pump(status: str, queue: asyncio.Queue) -> None:
+            stream = self.stream_sync_items(status=status, batch_limit=batch_limit, start_date=start_date,
+                                            end_date=end_date, concurrency=concurrency, seek=seek)
+            try:
+                async for item in stream:
+                    await queue.put(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await queue.put(e)
+                return
+            finally:
+                await stream.aclose()
+            await queue.put(None)
+        
+        async def push_next(heap: list, index: int) -> None:
+            item = await queues[index].get()
+            if isinstance(item, Exception):
+                raise item
+            if item is not None:
+                # stream_sync_items only yields items with a parseable createdAt; inverting
+                # the key's digits makes the min-heap pop the newest item first
+                key = timestamp_key(item["createdAt"]).translate(DESCENDING_KEY)
+                heapq.heappush(heap, (key, index, item))
+        
+        tasks = [asyncio.ensure_future(pump(status, queue)) for status, queue in zip(self.VALID_STATUSES, queues)]
+        try:
+            heap: list = []
+            for index in range(len(queues)):
+                await push_next(heap, index)
             
-            page += 1
-            if page > 100:
-                logging.warning("   Reached safety limit of 100 pages")
-                break
+            while heap:
+                _, index, item = heapq.heappop(heap)
+                yield item
+                await push_next(heap, index)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def probe_created_at(self, status: Optional[str], offset: int) -> Optional[datetime]:
+        """Return the createdAt of the item at `offset` (0-based, newest first), or None past the end."""
+        response = await self.query_sync_items(status=status, limit=1, page=offset + 1)
+        items = response.get("data", [])
+        if not items:
+            return None
+        return parse_iso_datetime(items[0].get("createdAt", ""))
+
+    async def find_offset(self, status: Optional[str], boundary: datetime) -> int:
+        """Find the first item offset whose createdAt is at or before `boundary`.
+
+        Results are sorted createdAt-desc, so this gallops forward with single-item probes
+        and then bisects, costing about 2*log2(offset) small requests.
+        """
+        async def at_or_past(offset: int) -> bool:
+            try:
+                created_at = await self.probe_created_at(status, offset)
+            except ValueError:
+                return True  # unparseable timestamp: err towards starting earlier
+            return created_at is None or created_at <= boundary
+
+        if await at_or_past(0):
+            return 0
+
+        # Gallop: find an offset range (lo, hi] that contains the boundary
+        lo, hi = 0, 1
+        while not await at_or_past(hi):
+            lo, hi = hi, hi * 2
+
+        # Bisect: at_or_past(lo) is False, at_or_past(hi) is True
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if await at_or_past(mid):
+                hi = mid
+            else:
+                lo = mid
+
+        logging.debug(f"   Boundary {format_iso_datetime(boundary)} is at item offset {hi}")
+        return hi
+
+    async def find_start_page(self, status: Optional[str], batch_limit: int,
+                              end_date: Optional[datetime]) -> int:
+        """First page (for `batch_limit`) that can contain items at or before `end_date`.
+
+        Returns 1 without probing when there is no end date or it is not in the past.
+        """
+        if end_date is None or end_date >= datetime.now(timezone.utc):
+            return 1
+        
+        logging.info(f"\n🔎 Seeking to the first page at or before {format_iso_datetime(end_date)}...")
+        offset = await self.find_offset(status, end_date)
+        start_page = offset // batch_limit + 1
+        if start_page > 1:
+            logging.info(f"   Skipping {start_page - 1} pages of newer items - starting at page {start_page}")
+        return start_page
+
+    async def _crawl_shard(self, queue: asyncio.Queue, status: Optional[str], batch_limit: int,
+                           start_page: int, lower: datetime, upper: datetime, include_lower: bool,
+                           concurrency: int = 1) -> None:
+        """Crawl one time shard from `start_page`, putting each page's matching items on `queue`.
+
+        The shard keeps paginating until it passes its lower bound rather than stopping at a
+        precomputed page, so items pushed onto later pages by new activity are not lost.
+        A final None marks the end of the shard; it is not sent when the shard is cancelled,
+        since a bounded queue may be full and nobody is reading it any more.
+        """
+        lower_key = datetime_key(lower)
+        upper_key = datetime_key(upper)
+        pages = self.iter_pages(status=status, batch_limit=batch_limit, start_page=start_page,
+                                concurrency=concurrency)
+        cancelled = False
+        try:
+            async for page, items in pages:
+                kept = []
+                reached_lower = False
+                for item, key in zip(items, page_timestamp_keys(items)):
+                    if key is None:
+                        continue
+                    
+                    if key > upper_key:
+                        continue
+                    if key < lower_key or (key == lower_key and not include_lower):
+                        reached_lower = True
+                        break
+                    kept.append(item)
+                
+                if kept:
+                    await queue.put(kept)
+                
+                if reached_lower or len(items) < batch_limit:
+                    break
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            await pages.aclose()
+            if not cancelled:
+                await queue.put(None)
+
+    async def stream_sync_items_sharded(self, status: Optional[str] = None, batch_limit: int = 30,
+                                        start_date: Optional[datetime] = None,
+                                        end_date: Optional[datetime] = None, shards: int = 4,
+                                        concurrency: int = 1,
+                                        buffer_size: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Crawl the date window as `shards` time slices in parallel, yielding items newest first.
+
+        The synclog API has no server-side date filter, so each shard's starting page is found
+        by bisecting the item offset of its upper time bound. Shards are yielded in order and
+        deduplicated by `id`. Later shards are buffered while earlier ones drain; with
+        `buffer_size` each shard buffers at most that many items (rounded up to whole pages)
+        and then waits, which bounds memory at the cost of shard parallelism.
+        """
+        if start_date is None:
+            raise ValueError("Sharded crawling requires a start date")
+        if end_date is None:
+            end_date = datetime.now(timezone.utc)
+        
+        span = (end_date - start_date) / shards
+        boundaries = [end_date - span * i for i in range(shards)] + [start_date]
+        
+        logging.info(f"\n🔀 Locating {shards} time shards...")
+        offsets = await asyncio.gather(*(self.find_offset(status, boundary) for boundary in boundaries[:-1]))
+        for i, offset in enumerate(offsets):
+            logging.info(f"   Shard {i + 1}: {format_iso_datetime(boundaries[i + 1])} .. "
+                         f"{format_iso_datetime(boundaries[i])} starts at page {offset // batch_limit + 1}")
+        
+        # Shards put whole pages on their queue; maxsize 0 is unbounded
+        max_pages = -(-buffer_size // batch_limit) if buffer_size else 0
+        queues = [asyncio.Queue(maxsize=max_pages) for _ in range(shards)]
+        tasks = [
+            asyncio.ensure_future(self._crawl_shard(
+                queues[i], status, batch_limit, start_page=offsets[i] // batch_limit + 1,
+                lower=boundaries[i + 1], upper=boundaries[i], include_lower=(i == shards - 1),
+                concurrency=concurrency
+            ))
+            for i in range(shards)
+        ]
+        
+        seen_ids = set()
+        try:
+            for i, queue in enumerate(queues):
+                shard_items = 0
+                while True:
+                    kept = await queue.get()
+                    if kept is None:
+                        break
+                    for item in kept:
+                        item_id = item.get("id")
+                        if item_id is not None:
+                            if item_id in seen_ids:
+                                continue
+                            seen_ids.add(item_id)
+                        shard_items += 1
+                        yield item
+                
+                # Surface any error raised by the shard
+                await tasks[i]
+                logging.info(f"   Shard {i + 1}/{shards} complete ({shard_items} items)")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class ItemCounts:
+    """Running totals of sync items by status, type and source."""
+    
+    def __init__(self):
+        self.total = 0
+        self.statuses: Dict[str, int] = {}
+        self.types: Dict[str, int] = {}
+        self.sources: Dict[str, int] = {}
+    
+    @classmethod
+    def from_items(cls, items: List[Dict[str, Any]]) -> "ItemCounts":
+        counts = cls()
+        for item in items:
+            counts.add(item)
+        return counts
+    
+    def add(self, item: Dict[str, Any]) -> None:
+        item_type = item.get("type", "unknown")
+        status = item.get("status", "unknown")
+        source = item.get("source", "unknown")
+        
+        self.total += 1
+        self.types[item_type] = self.types.get(item_type, 0) + 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.sources[source] = self.sources.get(source, 0) + 1
 
 
 def print_summary(items: List[Dict[str, Any]], status_filter: Optional[str] = None) -> None:
     """Print a summary of sync items."""
+    print_counts_summary(ItemCounts.from_items(items), status_filter)
+
+
+def print_counts_summary(counts: ItemCounts, status_filter: Optional[str] = None) -> None:
+    """Print a summary of sync items from running totals."""
     print("\n" + "="*80)
     print(f"SYNC ITEMS SUMMARY")
     if status_filter:
         print(f"Filter: status = {status_filter.upper()}")
     print("="*80)
-    print(f"Total items: {len(items)}")
+    print(f"Total items: {counts.total}")
     
-    if not items:
+    if not counts.total:
         print("No items found.")
         return
     
-    types = {}
-    statuses = {}
-    sources = {}
-    
-    for item in items:
-        item_type = item.get("type", "unknown")
-        status = item.get("status", "unknown")
-        source = item.get("source", "unknown")
-        
-        types[item_type] = types.get(item_type, 0) + 1
-        statuses[status] = statuses.get(status, 0) + 1
-        sources[source] = sources.get(source, 0) + 1
-    
-    if types:
+    if counts.types:
         print("\nItems by type:")
-        for item_type, count in sorted(types.items()):
+        for item_type, count in sorted(counts.types.items()):
             print(f"  {item_type}: {count}")
     
-    if statuses:
+    if counts.statuses:
         print("\nItems by status:")
-        for status, count in sorted(statuses.items()):
+        for status, count in sorted(counts.statuses.items()):
             print(f"  {status}: {count}")
     
-    if sources:
-        print("\nItems by source:")
-        for source, count in sorted(sources.items()):
-            print(f"  {source}: {count}")
+    if counts.sources:
+        print("\nItems by source:")
+        for source, count in sorted(counts.sources.items()):
+            print(f"  {source}: {count}")
+    
+    print("\n" + "="*80)
+
+
+class ErrorClusters:
+    """Group item messages into fingerprints in one streaming pass with bounded memory.
+
+    A fingerprint is the message with UUIDs, hex ids, timestamps, quoted values and
+    numbers masked, so "Fact sheet 4711 not found" and "Fact sheet 815 not found" land in
+    the same cluster. Once more than `max_clusters` distinct fingerprints are tracked,
+    the least frequent half is dropped and counted in `dropped_items`.
+    """
+    
+    MESSAGE_FIELDS = ('errorMessage', 'message')
+    PATTERNS = [
+        (re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'), '<uuid>'),
+        (re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?'), '<ts>'),
+        (re.compile(r'\b(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{16,}\b'), '<id>'),
+        (re.compile(r'"[^"]*"|\'[^\']*\''), '<str>'),
+        (re.compile(r'\d+(?:\.\d+)?'), '<n>'),
+        (re.compile(r'\s+'), ' '),
+    ]
+    MAX_FINGERPRINT_LENGTH = 300
+    
+    def __init__(self, max_clusters: int = 10000, max_examples: int = 3):
+        self.max_clusters = max_clusters
+        self.max_examples = max_examples
+        self.clusters: Dict[str, Dict[str, Any]] = {}
+        self.items_with_message = 0
+        self.dropped_items = 0
+        self._fingerprint_cache: Dict[str, str] = {}
+    
+    @classmethod
+    def from_items(cls, items: List[Dict[str, Any]], **kwargs) -> "ErrorClusters":
+        clusters = cls(**kwargs)
+        for item in items:
+            clusters.add(item)
+        return clusters
+    
+    @classmethod
+    def fingerprint(cls, message: str) -> str:
+        """Mask the variable parts of a message."""
+        for pattern, replacement in cls.PATTERNS:
+            message = pattern.sub(replacement, message)
+        return message.strip()[:cls.MAX_FINGERPRINT_LENGTH]
+    
+    def _cached_fingerprint(self, message: str) -> str:
+        # Most items repeat a handful of identical messages, so skip the regexes for those
+        fingerprint = self._fingerprint_cache.get(message)
+        if fingerprint is None:
+            if len(self._fingerprint_cache) >= self.max_clusters:
+                self._fingerprint_cache.clear()
+            fingerprint = self._fingerprint_cache[message] = self.fingerprint(message)
+        return fingerprint
+    
+    def add(self, item: Dict[str, Any]) -> None:
+        message = None
+        for field in self.MESSAGE_FIELDS:
+            message = item.get(field)
+            if message:
+                break
+        if not message:
+            return
+        if not isinstance(message, str):
+            message = json.dumps(message, sort_keys=True)
+        
+        self.items_with_message += 1
+        fingerprint = self._cached_fingerprint(message)
+        created_at = item.get("createdAt")
+        cluster = self.clusters.get(fingerprint)
+        if cluster is None:
+            if len(self.clusters) >= self.max_clusters:
+                self._evict()
+            cluster = self.clusters[fingerprint] = {
+                "fingerprint": fingerprint,
+                "count": 0,
+                "statuses": {},
+                "first_seen": None,
+                "last_seen": None,
+                "example_ids": [],
+                "_first_key": None,
+                "_last_key": None,
+            }
+        
+        cluster["count"] += 1
+        status = item.get("status", "unknown")
+        cluster["statuses"][status] = cluster["statuses"].get(status, 0) + 1
+        if created_at:
+            try:
+                key = timestamp_key(created_at)
+            except ValueError:
+                key = None
+            if key is not None:
+                if cluster["_first_key"] is None or key < cluster["_first_key"]:
+                    cluster["first_seen"], cluster["_first_key"] = created_at, key
+                if cluster["_last_key"] is None or key > cluster["_last_key"]:
+                    cluster["last_seen"], cluster["_last_key"] = created_at, key
+        if len(cluster["example_ids"]) < self.max_examples and item.get("id"):
+            cluster["example_ids"].append(item["id"])
+    
+    def _evict(self) -> None:
+        """Drop the least frequent half of the clusters to keep memory bounded."""
+        ranked = sorted(self.clusters.values(), key=lambda c: c["count"])
+        for cluster in ranked[:len(ranked) // 2]:
+            self.dropped_items += cluster["count"]
+            del self.clusters[cluster["fingerprint"]]
+    
+    def top(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Clusters ordered by count, largest first."""
+        ranked = sorted(self.clusters.values(), key=lambda c: (-c["count"], c["fingerprint"]))
+        return ranked[:limit] if limit else ranked
+
+
+class SyncRollup:
+    """Per-connector (or per-run) duration and error-rate rollups built with pandas.
+
+    Items are reduced to the few fields the rollup needs as they arrive, so it also works
+    on the streaming iterator; all statistics are then computed column-wise. `group_by`
+    is the item field to roll up on, e.g. `source` for connectors or a run id field.
+    """
+    
+    def __init__(self, group_by: str = "source", trend_days: int = 7):
+        if not PANDAS_AVAILABLE:
+            raise RuntimeError("Rollups require pandas. Install with: pip install pandas")
+        self.group_by = group_by
+        self.trend_days = trend_days
+        self._columns: Dict[str, List[Any]] = {"group": [], "status": [], "createdAt": [],
+                                               "startedAt": [], "finishedAt": []}
+        self._tables: Optional[Dict[str, "pd.DataFrame"]] = None
+    
+    @classmethod
+    def from_items(cls, items: List[Dict[str, Any]], **kwargs) -> "SyncRollup":
+        rollup = cls(**kwargs)
+        for item in items:
+            rollup.add(item)
+        return rollup
+    
+    def add(self, item: Dict[str, Any]) -> None:
+        self._tables = None
+        group = item.get(self.group_by)
+        self._columns["group"].append(group if isinstance(group, str) or group is None else json.dumps(group))
+        self._columns["status"].append(item.get("status"))
+        self._columns["createdAt"].append(item.get("createdAt"))
+        self._columns["startedAt"].append(item.get("startedAt"))
+        self._columns["finishedAt"].append(item.get("finishedAt"))
+    
+    def _frame(self) -> "pd.DataFrame":
+        df = pd.DataFrame(self._columns)
+        df["group"] = df["group"].fillna("unknown")
+        for column in ("createdAt", "startedAt", "finishedAt"):
+            df[column] = pd.to_datetime(df[column], utc=True, errors="coerce", format="ISO8601")
+        df["duration"] = (df["finishedAt"] - df["startedAt"]).dt.total_seconds()
+        df.loc[df["duration"] < 0, "duration"] = np.nan
+        df["error"] = (df["status"] == "ERROR").astype(np.int64)
+        df["warning"] = (df["status"] == "WARNING").astype(np.int64)
+        df["day"] = df["createdAt"].dt.floor("D")
+        return df
+    
+    @staticmethod
+    def _aggregate(grouped) -> "pd.DataFrame":
+        if grouped.ngroups == 0:
+            # quantile().unstack() has no 0.5/0.95 columns without groups
+            return pd.DataFrame(columns=["items", "errors", "warnings", "duration_mean", "duration_max",
+                                         "duration_p50", "duration_p95", "error_rate", "warning_rate"])
+        stats = grouped.agg(items=("status", "size"), errors=("error", "sum"), warnings=("warning", "sum"),
+                            duration_mean=("duration", "mean"), duration_max=("duration", "max"))
+        quantiles = grouped["duration"].quantile([0.5, 0.95]).unstack()
+        stats["duration_p50"] = quantiles[0.5]
+        stats["duration_p95"] = quantiles[0.95]
+        stats["error_rate"] = stats["errors"] / stats["items"]
+        stats["warning_rate"] = stats["warnings"] / stats["items"]
+        return stats
+    
+    def build(self) -> Dict[str, "pd.DataFrame"]:
+        """Return the `summary` (per group, with trend deltas) and `daily` tables."""
+        if self._tables is None:
+            self._tables = self._build()
+        return self._tables
+    
+    def _build(self) -> Dict[str, "pd.DataFrame"]:
+        df = self._frame()
+        column_order = ["items", "errors", "error_rate", "warnings", "warning_rate",
+                        "duration_p50", "duration_p95", "duration_mean", "duration_max"]
+        if df.empty:
+            return {"summary": pd.DataFrame(columns=[self.group_by] + column_order),
+                    "daily": pd.DataFrame(columns=[self.group_by, "day"] + column_order)}
+        
+        summary = self._aggregate(df.groupby("group"))[column_order]
+        dated = df.dropna(subset=["day"])
+        daily = self._aggregate(dated.groupby(["group", "day"]))[column_order] if not dated.empty else None
+        
+        # Trend: the last `trend_days` days against the same number of days before them
+        latest = df["createdAt"].max()
+        window = pd.Timedelta(days=self.trend_days)
+        recent = df[df["createdAt"] > latest - window]
+        previous = df[(df["createdAt"] <= latest - window) & (df["createdAt"] > latest - 2 * window)]
+        if recent.empty or previous.empty:
+            # Harvests shorter than two windows have nothing to compare against
+            summary["error_rate_delta"] = np.nan
+            summary["duration_p95_delta"] = np.nan
+            summary["degrading"] = False
+        else:
+            recent_stats = self._aggregate(recent.groupby("group"))
+            previous_stats = self._aggregate(previous.groupby("group"))
+            summary["error_rate_delta"] = recent_stats["error_rate"].sub(previous_stats["error_rate"])
+            summary["duration_p95_delta"] = recent_stats["duration_p95"].sub(previous_stats["duration_p95"])
+            summary["degrading"] = (summary["error_rate_delta"] > 0.05) | \
+                (summary["duration_p95_delta"] > previous_stats["duration_p95"].reindex(summary.index) * 0.5)
+        
+        summary = summary.sort_values(["error_rate", "items"], ascending=False)
+        summary.index.name = self.group_by
+        if daily is None:
+            daily = pd.DataFrame(columns=[self.group_by, "day"] + column_order)
+        else:
+            daily.index.names = [self.group_by, "day"]
+            daily = daily.reset_index()
+            daily["day"] = daily["day"].dt.strftime("%Y-%m-%d")
+        return {"summary": summary.reset_index(), "daily": daily}
+    
+    def write_csv(self, prefix: str) -> List[str]:
+        """Write `{prefix}_summary.csv` and `{prefix}_daily.csv`."""
+        filenames = []
+        for name, table in self.build().items():
+            filename = f"{prefix}_{name}.csv"
+            table.to_csv(filename, index=False, float_format="%.4f")
+            filenames.append(filename)
+        return filenames
+
+
+def print_rollup(rollup: "SyncRollup", limit: int = 20) -> None:
+    """Print the per-group rollup, worst error rate first."""
+    summary = rollup.build()["summary"]
+    print("\n" + "="*80)
+    print(f"ROLLUP BY {rollup.group_by.upper()} (trend: last {rollup.trend_days} days vs the {rollup.trend_days} before)")
+    print("="*80)
+    if summary.empty:
+        print("No items found.")
+        print("="*80)
+        return
+    print(f"{rollup.group_by[:24]:<24} {'Items':>8} {'Err %':>7} {'Δ Err':>7} {'p50 s':>8} {'p95 s':>8} {'Δ p95':>8}")
+    for row in summary.head(limit).itertuples(index=False):
+        values = row._asdict()
+        flag = "  ⚠ degrading" if values["degrading"] else ""
+        
+        def fmt(value: Any, pattern: str) -> str:
+            return "-" if pd.isna(value) else format(value, pattern)
+        
+        print(f"{str(values[rollup.group_by])[:24]:<24} {values['items']:>8} {fmt(values['error_rate'] * 100, '7.1f')} "
+              f"{fmt(values['error_rate_delta'] * 100, '+7.1f')} {fmt(values['duration_p50'], '8.1f')} "
+              f"{fmt(values['duration_p95'], '8.1f')} {fmt(values['duration_p95_delta'], '+8.1f')}{flag}")
+    if len(summary) > limit:
+        print(f"... {len(summary) - limit} more (see the Excel rollup sheets or --rollup-csv)")
+    print("="*80)
+
+
+def print_error_clusters(clusters: ErrorClusters, limit: Optional[int] = None,
+                         title: str = "MESSAGE CLUSTERS") -> None:
+    """Print the largest message clusters as a triage table."""
+    print("\n" + "="*80)
+    print(title)
+    print("="*80)
+    print(f"Items with a message: {clusters.items_with_message} in {len(clusters.clusters)} clusters")
+    if clusters.dropped_items:
+        print(f"Items in rare clusters dropped to bound memory: {clusters.dropped_items}")
+    
+    for cluster in clusters.top(limit):
+        statuses = ", ".join(f"{status} {count}" for status, count in sorted(cluster["statuses"].items()))
+        print(f"\n  {cluster['count']:>8}  {cluster['fingerprint']}")
+        print(f"            {statuses} | first {cluster['first_seen'] or '-'} | last {cluster['last_seen'] or '-'}")
+        print(f"            e.g. {', '.join(cluster['example_ids'])}")
     
     print("\n" + "="*80)
 
 
+def build_error_cluster_rows(clusters: ErrorClusters, limit: Optional[int] = None) -> List[List[Any]]:
+    """Rows of the Excel "Error Clusters" sheet, header first."""
+    rows = [EXCEL_CLUSTER_HEADERS]
+    for cluster in clusters.top(limit):
+        rows.append([
+            cluster["count"],
+            cluster["fingerprint"],
+            ", ".join(f"{status} {count}" for status, count in sorted(cluster["statuses"].items())),
+            excel_cell_value("createdAt", cluster["first_seen"] or ""),
+            excel_cell_value("createdAt", cluster["last_seen"] or ""),
+            ", ".join(cluster["example_ids"]),
+        ])
+    return rows
+
+
 def save_to_file(items: List[Dict[str, Any]], filename: str, status_filter: Optional[str] = None) -> None:
     """Save sync items to a JSON file."""
     output = {
@@ -426,7 +1802,7 @@ def save_to_file(items: List[Dict[str, Any]], filename: str, status_filter: Opti
     
     try:
         with open(filename, 'w') as f:
-            json.dump(output, f, indent=2)
+            json.dump(output, f, indent=2, default=json_default)
         
         print(f"\n💾 Saved {len(items)} items to {filename}")
     except Exception as e:
@@ -434,10 +1810,160 @@ def save_to_file(items: List[Dict[str, Any]], filename: str, status_filter: Opti
         raise
 
 
+EXCEL_PREFERRED_COLUMNS = [
+    'id', 'status', 'type', 'source', 'createdAt', 'updatedAt',
+    'startedAt', 'finishedAt', 'message', 'errorMessage', 'workspaceId'
+]
+EXCEL_DATETIME_COLUMNS = ['createdAt', 'updatedAt', 'startedAt', 'finishedAt']
+EXCEL_SUMMARY_HEADERS = ["Report Generated", "Status Breakdown", "Type Breakdown", "Source Breakdown"]
+EXCEL_CLUSTER_HEADERS = ["Count", "Fingerprint", "Statuses", "First Seen", "Last Seen", "Example IDs"]
+EXCEL_CLUSTER_WIDTHS = [10, 80, 25, 20, 20, 50]
+
+
+def order_excel_headers(keys) -> List[str]:
+    """Order headers: preferred columns first, then remaining keys alphabetically."""
+    remaining = set(keys)
+    headers = []
+    for key in EXCEL_PREFERRED_COLUMNS:
+        if key in remaining:
+            headers.append(key)
+            remaining.remove(key)
+    headers.extend(sorted(remaining))
+    return headers
+
+
+def excel_cell_value(header: str, value: Any) -> Any:
+    """Convert an item field to the value written into the Excel sheet."""
+    # Format datetime values
+    if header in EXCEL_DATETIME_COLUMNS and value:
+        if isinstance(value, str) and len(value) >= 20 and value[-1] == 'Z' and value[10] == 'T':
+            return value[:10] + ' ' + value[11:19]  # API format, no parsing needed
+        try:
+            dt = parse_iso_datetime(value)
+            value = dt.strftime('%Y-%m-%d %H:%M:%S')
+        except:
+            pass  # Keep original value if parsing fails
+    
+    # Handle nested objects/arrays
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    
+    return value
+
+
+def status_fill(value: Any) -> Optional["PatternFill"]:
+    """Background colour used to highlight a status cell, if any."""
+    if value == 'SUCCESS':
+        return PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+    elif value == 'FAILED':
+        return PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+    elif value == 'RUNNING':
+        return PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
+    return None
+
+
+def build_summary_rows(counts: ItemCounts, status_filter: Optional[str] = None,
+                       start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                       date_range_defaulted: bool = False) -> List[List[Any]]:
+    """Build the label/value rows of the Excel Summary sheet."""
+    summary_data = [
+        ["Report Generated", datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+        ["Status Filter", status_filter if status_filter else "All"],
+        ["Total Items", counts.total],
+    ]
+    
+    # Add date range information
+    if start_date:
+        start_label = "Start Date"
+        if date_range_defaulted:
+            start_label += " (Default)"
+        summary_data.append([start_label, start_date.strftime('%Y-%m-%d %H:%M:%S %Z')])
+    
+    if end_date:
+        end_label = "End Date"
+        if date_range_defaulted:
+            end_label += " (Default)"
+        summary_data.append([end_label, end_date.strftime('%Y-%m-%d %H:%M:%S %Z')])
+    
+    if date_range_defaulted:
+        summary_data.append(["Date Range Note", "Last 30 days (auto-applied)"])
+    
+    summary_data.extend([
+        ["", ""],  # Empty row
+        ["Status Breakdown", "Count"]
+    ])
+    
+    # Add status counts
+    for status, count in sorted(counts.statuses.items()):
+        summary_data.append([status, count])
+    
+    summary_data.extend([
+        ["", ""],  # Empty row
+        ["Type Breakdown", "Count"]
+    ])
+    
+    # Add type counts
+    for item_type, count in sorted(counts.types.items()):
+        summary_data.append([item_type, count])
+    
+    summary_data.extend([
+        ["", ""],  # Empty row
+        ["Source Breakdown", "Count"]
+    ])
+    
+    # Add source counts
+    for source, count in sorted(counts.sources.items()):
+        summary_data.append([source, count])
+    
+    return summary_data
+
+
+def add_table_sheet(wb: "Workbook", title: str, rows: List[List[Any]], widths: List[int]) -> None:
+    """Add a sheet with a bold header row to a regular or write-only workbook."""
+    ws = wb.create_sheet(title)
+    for col_idx, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
+    
+    if wb.write_only:
+        header_cells = []
+        for header in rows[0]:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = Font(bold=True)
+            header_cells.append(cell)
+        ws.append(header_cells)
+    else:
+        ws.append(rows[0])
+        for cell in ws[1]:
+            cell.font = Font(bold=True)
+    for row in rows[1:]:
+        ws.append(row)
+
+
+def add_error_clusters_sheet(wb: "Workbook", clusters: ErrorClusters, limit: Optional[int] = None) -> None:
+    """Add an "Error Clusters" triage sheet."""
+    add_table_sheet(wb, "Error Clusters", build_error_cluster_rows(clusters, limit), EXCEL_CLUSTER_WIDTHS)
+
+
+def add_rollup_sheets(wb: "Workbook", rollup: "SyncRollup") -> None:
+    """Add the "Rollup" (per group, with trends) and "Daily Rollup" sheets."""
+    tables = rollup.build()
+    for title, table in (("Rollup", tables["summary"]), ("Daily Rollup", tables["daily"])):
+        # Plain Python values; openpyxl cannot write numpy scalars or NaN
+        rows = [list(table.columns)]
+        for values in table.astype(object).where(table.notna(), None).itertuples(index=False):
+            rows.append([value.item() if hasattr(value, "item") else value for value in values])
+        add_table_sheet(wb, title, rows, [max(len(str(column)) + 2, 12) for column in table.columns])
+
+
 def save_to_excel(items: List[Dict[str, Any]], filename: str, status_filter: Optional[str] = None, 
                   start_date: Optional[datetime] = None, end_date: Optional[datetime] = None, 
-                  date_range_defaulted: bool = False) -> None:
-    """Save sync items to an Excel file with formatting."""
+                  date_range_defaulted: bool = False, error_clusters: Optional[ErrorClusters] = None,
+                  cluster_limit: Optional[int] = None, rollup: Optional["SyncRollup"] = None) -> None:
+    """Save sync items to an Excel file with formatting.
+
+    With `error_clusters`, an "Error Clusters" sheet lists the top `cluster_limit` clusters;
+    with `rollup`, "Rollup" and "Daily Rollup" sheets are added.
+    """
     if not EXCEL_AVAILABLE:
         logging.error("Excel export not available. Install openpyxl with: pip install openpyxl")
         return
@@ -460,19 +1986,7 @@ def save_to_excel(items: List[Dict[str, Any]], filename: str, status_filter: Opt
         for item in items:
             all_keys.update(item.keys())
         
-        # Define preferred column order
-        preferred_order = [
-            'id', 'status', 'type', 'source', 'createdAt', 'updatedAt',
-            'startedAt', 'finishedAt', 'message', 'errorMessage', 'workspaceId'
-        ]
-        
-        # Order headers: preferred first, then remaining alphabetically
-        headers = []
-        for key in preferred_order:
-            if key in all_keys:
-                headers.append(key)
-                all_keys.remove(key)
-        headers.extend(sorted(all_keys))
+        headers = order_excel_headers(all_keys)
         
         # Write headers
         for col, header in enumerate(headers, 1):
@@ -484,30 +1998,15 @@ def save_to_excel(items: List[Dict[str, Any]], filename: str, status_filter: Opt
         # Write data rows
         for row_idx, item in enumerate(items, 2):
             for col_idx, header in enumerate(headers, 1):
-                value = item.get(header, "")
-                
-                # Format datetime values
-                if header in ['createdAt', 'updatedAt', 'startedAt', 'finishedAt'] and value:
-                    try:
-                        dt = parse_iso_datetime(value)
-                        value = dt.strftime('%Y-%m-%d %H:%M:%S')
-                    except:
-                        pass  # Keep original value if parsing fails
-                
-                # Handle nested objects/arrays
-                if isinstance(value, (dict, list)):
-                    value = json.dumps(value)
+                value = excel_cell_value(header, item.get(header, ""))
                 
                 cell = ws.cell(row=row_idx, column=col_idx, value=value)
                 
                 # Color code by status
                 if header == 'status':
-                    if value == 'SUCCESS':
-                        cell.fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-                    elif value == 'FAILED':
-                        cell.fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-                    elif value == 'RUNNING':
-                        cell.fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
+                    fill = status_fill(value)
+                    if fill:
+                        cell.fill = fill
         
         # Auto-adjust column widths
         for column in ws.columns:
@@ -527,69 +2026,8 @@ def save_to_excel(items: List[Dict[str, Any]], filename: str, status_filter: Opt
         # Create summary worksheet
         summary_ws = wb.create_sheet("Summary")
         
-        # Summary data
-        summary_data = [
-            ["Report Generated", datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
-            ["Status Filter", status_filter if status_filter else "All"],
-            ["Total Items", len(items)],
-        ]
-        
-        # Add date range information
-        if start_date:
-            start_label = "Start Date"
-            if date_range_defaulted:
-                start_label += " (Default)"
-            summary_data.append([start_label, start_date.strftime('%Y-%m-%d %H:%M:%S %Z')])
-        
-        if end_date:
-            end_label = "End Date"
-            if date_range_defaulted:
-                end_label += " (Default)"
-            summary_data.append([end_label, end_date.strftime('%Y-%m-%d %H:%M:%S %Z')])
-        
-        if date_range_defaulted:
-            summary_data.append(["Date Range Note", "Last 30 days (auto-applied)"])
-        
-        summary_data.extend([
-            ["", ""],  # Empty row
-            ["Status Breakdown", "Count"]
-        ])
-        
-        # Count by status
-        status_counts = {}
-        type_counts = {}
-        source_counts = {}
-        
-        for item in items:
-            status = item.get('status', 'unknown')
-            item_type = item.get('type', 'unknown')
-            source = item.get('source', 'unknown')
-            
-            status_counts[status] = status_counts.get(status, 0) + 1
-            type_counts[item_type] = type_counts.get(item_type, 0) + 1
-            source_counts[source] = source_counts.get(source, 0) + 1
-        
-        # Add status counts
-        for status, count in sorted(status_counts.items()):
-            summary_data.append([status, count])
-        
-        summary_data.extend([
-            ["", ""],  # Empty row
-            ["Type Breakdown", "Count"]
-        ])
-        
-        # Add type counts
-        for item_type, count in sorted(type_counts.items()):
-            summary_data.append([item_type, count])
-        
-        summary_data.extend([
-            ["", ""],  # Empty row
-            ["Source Breakdown", "Count"]
-        ])
-        
-        # Add source counts
-        for source, count in sorted(source_counts.items()):
-            summary_data.append([source, count])
+        summary_data = build_summary_rows(ItemCounts.from_items(items), status_filter, start_date, end_date,
+                                          date_range_defaulted)
         
         # Write summary data
         for row_idx, (label, value) in enumerate(summary_data, 1):
@@ -597,7 +2035,7 @@ def save_to_excel(items: List[Dict[str, Any]], filename: str, status_filter: Opt
             summary_ws.cell(row=row_idx, column=2, value=value)
             
             # Format headers
-            if label in ["Report Generated", "Status Breakdown", "Type Breakdown", "Source Breakdown"]:
+            if label in EXCEL_SUMMARY_HEADERS:
                 summary_ws.cell(row=row_idx, column=1).font = Font(bold=True)
                 summary_ws.cell(row=row_idx, column=2).font = Font(bold=True)
         
@@ -605,15 +2043,737 @@ def save_to_excel(items: List[Dict[str, Any]], filename: str, status_filter: Opt
         summary_ws.column_dimensions['A'].width = 20
         summary_ws.column_dimensions['B'].width = 15
         
+        if error_clusters is not None:
+            add_error_clusters_sheet(wb, error_clusters, cluster_limit)
+        if rollup is not None:
+            add_rollup_sheets(wb, rollup)
+        
         wb.save(filename)
         print(f"\n📊 Saved {len(items)} items to Excel file: {filename}")
         print(f"   Worksheets: 'Sync Items' (data) and 'Summary' (statistics)")
+        if error_clusters is not None:
+            print(f"   Worksheet 'Error Clusters' groups {error_clusters.items_with_message} messages")
+        if rollup is not None:
+            print(f"   Worksheets 'Rollup' and 'Daily Rollup' group items by {rollup.group_by}")
         
     except Exception as e:
         logging.error(f"Failed to save Excel file {filename}: {e}")
         raise
 
 
+class NdjsonWriter:
+    """Write sync items as newline-delimited JSON, optionally gzip-compressed.
+
+    Each item is written as soon as it arrives, so memory use does not grow with the
+    export and consumers such as jq or Spark can read the file line by line.
+    """
+    
+    def __init__(self, filename: str, compress: bool = False, append: bool = False):
+        if compress and not filename.endswith(".gz"):
+            filename += ".gz"
+        self.filename = filename
+        self.items_written = 0
+        mode = "at" if append else "wt"
+        if filename.endswith(".gz"):
+            self._file = gzip.open(filename, mode, encoding="utf-8")
+        else:
+            self._file = open(filename, mode, encoding="utf-8")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def write(self, item: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(item, separators=(",", ":"), default=json_default) + "\n")
+        self.items_written += 1
+    
+    def write_items(self, items: List[Dict[str, Any]]) -> None:
+        for item in items:
+            self.write(item)
+    
+    def flush(self) -> None:
+        self._file.flush()
+    
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class ParquetWriter:
+    """Write sync items to a Parquet file one row group at a time.
+
+    Nested objects are flattened into dotted columns (`a.b`), lists are stored as JSON
+    text and `*At` fields become UTC timestamp columns. The schema is inferred from the
+    first row group; fields first seen later are left out. When a later value does not fit
+    its column, the column is widened (int to float, anything else to string) and the row
+    groups already written are rewritten; only unparseable timestamps are stored as null.
+    """
+    
+    def __init__(self, filename: str, row_group_size: int = 10000):
+        if not PARQUET_AVAILABLE:
+            raise RuntimeError("Parquet export requires pyarrow. Install with: pip install pyarrow")
+        self.filename = filename
+        self.row_group_size = row_group_size
+        self.items_written = 0
+        self.schema: Optional["pa.Schema"] = None
+        self._rows: List[Dict[str, Any]] = []
+        self._writer: Optional["pq.ParquetWriter"] = None
+        self._ignored_keys = set()
+        self._nulled_values: Dict[str, int] = {}
+        self.closed = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    @staticmethod
+    def flatten(item: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        """Flatten nested objects into dotted keys; lists become JSON text."""
+        row = {}
+        for key, value in item.items():
+            name = f"{prefix}{key}"
+            if isinstance(value, dict):
+                row.update(ParquetWriter.flatten(value, f"{name}."))
+            elif isinstance(value, list):
+                row[name] = json.dumps(value)
+            else:
+                row[name] = value
+        return row
+    
+    @staticmethod
+    def _infer_type(name: str, values: List[Any]) -> "pa.DataType":
+        if name.rsplit(".", 1)[-1].endswith("At"):
+            return pa.timestamp("us", tz="UTC")
+        kinds = {type(value) for value in values if value is not None}
+        if kinds == {bool}:
+            return pa.bool_()
+        if kinds == {int}:
+            return pa.int64()
+        if kinds and kinds <= {int, float}:
+            return pa.float64()
+        return pa.string()
+    
+    @staticmethod
+    def _widen_type(data_type: "pa.DataType", values: List[Any]) -> "pa.DataType":
+        """The narrowest type that holds both `data_type` and `values`."""
+        if pa.types.is_timestamp(data_type) or pa.types.is_string(data_type):
+            return data_type
+        kinds = {type(value) for value in values if value is not None}
+        if pa.types.is_boolean(data_type):
+            return data_type if kinds <= {bool} else pa.string()
+        if pa.types.is_integer(data_type) and kinds <= {int}:
+            return data_type
+        return pa.float64() if kinds <= {int, float} else pa.string()
+    
+    @staticmethod
+    def _convert(value: Any, data_type: "pa.DataType") -> Any:
+        if value is None:
+            return None
+        if pa.types.is_timestamp(data_type):
+            if not isinstance(value, str):
+                return None
+            try:
+                dt = parse_iso_datetime(value)
+            except ValueError:
+                return None
+            return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+        if pa.types.is_string(data_type):
+            return value if isinstance(value, str) else json.dumps(value)
+        if pa.types.is_boolean(data_type):
+            return value if isinstance(value, bool) else None
+        if pa.types.is_integer(data_type):
+            return value if isinstance(value, int) and not isinstance(value, bool) else None
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return None
+    
+    def write(self, item: Dict[str, Any]) -> None:
+        self._rows.append(self.flatten(item))
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+    
+    def write_items(self, items: List[Dict[str, Any]]) -> None:
+        for item in items:
+            self.write(item)
+    
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        if self.schema is None:
+            names = set()
+            for row in self._rows:
+                names.update(row.keys())
+            fields = []
+            for name in order_excel_headers(names):
+                fields.append(pa.field(name, self._infer_type(name, [row.get(name) for row in self._rows])))
+            self.schema = pa.schema(fields)
+            self._writer = pq.ParquetWriter(self.filename, self.schema, compression="zstd")
+        else:
+            widened = pa.schema([pa.field(field.name, self._widen_type(field.type, [row.get(field.name) for row in self._rows]))
+                                 for field in self.schema])
+            if not widened.equals(self.schema):
+                self._rewrite(widened)
+        
+        columns = {}
+        for field in self.schema:
+            values = [row.get(field.name) for row in self._rows]
+            columns[field.name] = [self._convert(value, field.type) for value in values]
+            nulled = sum(1 for value, converted in zip(values, columns[field.name])
+                         if value is not None and converted is None)
+            if nulled:
+                self._nulled_values[field.name] = self._nulled_values.get(field.name, 0) + nulled
+        for row in self._rows:
+            self._ignored_keys.update(name for name in row if name not in columns)
+        
+        self._writer.write_table(pa.Table.from_pydict(columns, schema=self.schema))
+        self.items_written += len(self._rows)
+        self._rows = []
+    
+    def _rewrite(self, schema: "pa.Schema") -> None:
+        """Reopen the file with a wider schema and cast the row groups already written into it."""
+        widened = [f"{new.name} ({old.type} → {new.type})" for new, old in zip(schema, self.schema) if new.type != old.type]
+        logging.info(f"Widening Parquet columns, rewriting {self.items_written} items: {', '.join(widened)}")
+        self._writer.close()
+        previous = f"{self.filename}.previous"
+        os.replace(self.filename, previous)
+        self._writer = pq.ParquetWriter(self.filename, schema, compression="zstd")
+        with pq.ParquetFile(previous) as source:
+            for batch in source.iter_batches(batch_size=self.row_group_size):
+                self._writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+        os.remove(previous)
+        self.schema = schema
+    
+    def close(self) -> None:
+        """Write the last row group and finish the file."""
+        if self.closed:
+            return
+        self.closed = True
+        if self._writer is None and not self._rows:
+            # Still produce a valid (empty) file
+            self.schema = pa.schema([pa.field("id", pa.string())])
+            self._writer = pq.ParquetWriter(self.filename, self.schema, compression="zstd")
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._ignored_keys:
+            logging.warning(f"⚠ Fields not present in the first {self.row_group_size} items were left out of the Parquet file: "
+                            f"{', '.join(sorted(self._ignored_keys))}")
+        if self._nulled_values:
+            logging.warning(f"⚠ Values that could not be parsed were stored as null in the Parquet file: "
+                            f"{', '.join(f'{name} ({count})' for name, count in sorted(self._nulled_values.items()))}")
+
+
+class StreamingExcelWriter:
+    """Write sync items to Excel as they arrive, using constant memory.
+
+    Built on openpyxl's write-only workbook, which streams rows to disk. Headers and
+    column widths must be fixed before the first row is written, so they are inferred
+    from the first `sample_size` items; the Summary sheet counts are kept as running totals.
+    """
+    
+    def __init__(self, filename: str, status_filter: Optional[str] = None,
+                 start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                 date_range_defaulted: bool = False, sample_size: int = 1000,
+                 error_clusters: Optional[ErrorClusters] = None, cluster_limit: Optional[int] = None,
+                 rollup: Optional["SyncRollup"] = None):
+        self.filename = filename
+        self.rollup = rollup
+        self.error_clusters = error_clusters
+        self.cluster_limit = cluster_limit
+        self.status_filter = status_filter
+        self.start_date = start_date
+        self.end_date = end_date
+        self.date_range_defaulted = date_range_defaulted
+        self.sample_size = sample_size
+        self.counts = ItemCounts()
+        self.headers: Optional[List[str]] = None
+        self._sample: List[Dict[str, Any]] = []
+        self._ignored_keys = set()
+        
+        self.wb = Workbook(write_only=True)
+        self.ws = self.wb.create_sheet("Sync Items")
+    
+    def add(self, item: Dict[str, Any]) -> None:
+        self.counts.add(item)
+        if self.headers is None:
+            self._sample.append(item)
+            if len(self._sample) >= self.sample_size:
+                self._start_rows()
+            return
+        self._write_row(item)
+    
+    def _start_rows(self) -> None:
+        """Fix headers and widths from the sample, then flush the sampled rows."""
+        all_keys = set()
+        for item in self._sample:
+            all_keys.update(item.keys())
+        self.headers = order_excel_headers(all_keys)
+        
+        # Widths use the same rule as save_to_excel, measured over the sample
+        widths = [len(header) for header in self.headers]
+        for item in self._sample:
+            for col_idx, header in enumerate(self.headers):
+                widths[col_idx] = max(widths[col_idx], len(str(excel_cell_value(header, item.get(header, "")))))
+        for col_idx, width in enumerate(widths, 1):
+            self.ws.column_dimensions[get_column_letter(col_idx)].width = min(max(width + 2, 10), 50)
+        
+        header_cells = []
+        for header in self.headers:
+            cell = WriteOnlyCell(self.ws, value=header)
+            cell.font = Font(bold=True)
+            cell.fill = PatternFill(start_color="CCE5FF", end_color="CCE5FF", fill_type="solid")
+            cell.alignment = Alignment(horizontal="center")
+            header_cells.append(cell)
+        self.ws.append(header_cells)
+        
+        for item in self._sample:
+            self._write_row(item)
+        self._sample = []
+    
+    def _write_row(self, item: Dict[str, Any]) -> None:
+        row = []
+        for header in self.headers:
+            value = excel_cell_value(header, item.get(header, ""))
+            fill = status_fill(value) if header == 'status' else None
+            if fill:
+                cell = WriteOnlyCell(self.ws, value=value)
+                cell.fill = fill
+                row.append(cell)
+            else:
+                row.append(value)
+        self.ws.append(row)
+        
+        if len(item) > len(self.headers):
+            self._ignored_keys.update(key for key in item if key not in self.headers)
+    
+    def close(self) -> None:
+        """Write the Summary sheet and save the workbook."""
+        try:
+            if self.headers is None:
+                if self._sample:
+                    self._start_rows()
+                else:
+                    self.ws.append(["No sync items found"])
+            
+            summary_ws = self.wb.create_sheet("Summary")
+            summary_ws.column_dimensions['A'].width = 20
+            summary_ws.column_dimensions['B'].width = 15
+            for label, value in build_summary_rows(self.counts, self.status_filter, self.start_date,
+                                                   self.end_date, self.date_range_defaulted):
+                if label in EXCEL_SUMMARY_HEADERS:
+                    label_cell = WriteOnlyCell(summary_ws, value=label)
+                    label_cell.font = Font(bold=True)
+                    value_cell = WriteOnlyCell(summary_ws, value=value)
+                    value_cell.font = Font(bold=True)
+                    summary_ws.append([label_cell, value_cell])
+                else:
+                    summary_ws.append([label, value])
+            
+            # The clusters and rollup are filled by the caller as items stream past
+            if self.error_clusters is not None:
+                add_error_clusters_sheet(self.wb, self.error_clusters, self.cluster_limit)
+            if self.rollup is not None:
+                add_rollup_sheets(self.wb, self.rollup)
+            
+            self.wb.save(self.filename)
+        except Exception as e:
+            logging.error(f"Failed to save Excel file {self.filename}: {e}")
+            raise
+        
+        if self._ignored_keys:
+            logging.warning(f"⚠ Fields not present in the first {self.sample_size} items were left out of the Excel file: "
+                            f"{', '.join(sorted(self._ignored_keys))} (use --output for a complete JSON export)")
+        print(f"\n📊 Saved {self.counts.total} items to Excel file: {self.filename}")
+        print(f"   Worksheets: 'Sync Items' (data) and 'Summary' (statistics)")
+        if self.error_clusters is not None:
+            print(f"   Worksheet 'Error Clusters' groups {self.error_clusters.items_with_message} messages")
+        if self.rollup is not None:
+            print(f"   Worksheets 'Rollup' and 'Daily Rollup' group items by {self.rollup.group_by}")
+
+
+class SyncItemStore:
+    """Local SQLite store of harvested sync items, indexed for offline queries.
+
+    Well-known fields get their own indexed columns; the full item is kept as JSON so
+    nothing returned by the API is lost. Items are upserted by `id`, so overlapping
+    harvests can be written to the same database.
+    """
+    
+    COLUMNS = ['status', 'type', 'source', 'createdAt', 'updatedAt', 'startedAt', 'finishedAt',
+               'message', 'errorMessage', 'workspaceId']
+    INDEXED_COLUMNS = ['status', 'type', 'source', 'createdAt', 'workspaceId']
+    
+    def __init__(self, path: str, batch_size: int = 1000):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending: List[tuple] = []
+        self.items_written = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        
+        columns = ", ".join(f'"{column}" TEXT' for column in self.COLUMNS)
+        self.conn.execute(f'CREATE TABLE IF NOT EXISTS sync_items ("id" TEXT PRIMARY KEY, {columns}, "data" TEXT)')
+        for column in self.INDEXED_COLUMNS:
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS idx_sync_items_{column} ON sync_items ("{column}")')
+        self.conn.commit()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    @staticmethod
+    def normalize_timestamp(value: Any) -> Any:
+        """Store timestamps as fixed-width UTC strings so they compare correctly as text."""
+        if not value or not isinstance(value, str):
+            return value
+        try:
+            return timestamp_key(value) + 'Z'
+        except ValueError:
+            return value
+    
+    def _row(self, item: Dict[str, Any]) -> tuple:
+        values = [item.get("id")]
+        for column in self.COLUMNS:
+            value = item.get(column)
+            if column.endswith("At"):
+                value = self.normalize_timestamp(value)
+            elif isinstance(value, (dict, list)):
+                value = json.dumps(value)
+            values.append(value)
+        values.append(json.dumps(item, default=json_default))
+        return tuple(values)
+    
+    def add(self, item: Dict[str, Any]) -> None:
+        """Buffer one item, writing a batch once `batch_size` items are pending."""
+        self._pending.append(self._row(item))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    
+    def add_items(self, items: List[Dict[str, Any]]) -> None:
+        for item in items:
+            self.add(item)
+        self.flush()
+    
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        placeholders = ", ".join("?" for _ in range(len(self.COLUMNS) + 2))
+        columns = ", ".join(f'"{column}"' for column in ["id"] + self.COLUMNS + ["data"])
+        self.conn.executemany(f"INSERT OR REPLACE INTO sync_items ({columns}) VALUES ({placeholders})", self._pending)
+        self.conn.commit()
+        self.items_written += len(self._pending)
+        self._pending = []
+    
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
+    
+    def count_by(self, group_by: str, status: Optional[str] = None,
+                 since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[tuple]:
+        """Count items grouped by a column (or by day), optionally filtered by status and time."""
+        if group_by == "day":
+            group_expr = 'substr("createdAt", 1, 10)'
+        elif group_by in self.INDEXED_COLUMNS:
+            group_expr = f'"{group_by}"'
+        else:
+            raise ValueError(f"Cannot group by '{group_by}'")
+        
+        conditions = []
+        params: List[Any] = []
+        if status:
+            conditions.append('"status" = ?')
+            params.append(status.upper())
+        if since:
+            conditions.append('"createdAt" >= ?')
+            params.append(self.normalize_timestamp(format_iso_datetime(since)))
+        if until:
+            conditions.append('"createdAt" <= ?')
+            params.append(self.normalize_timestamp(format_iso_datetime(until)))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        query = (f'SELECT {group_expr} AS grp, COUNT(*), MIN("createdAt"), MAX("createdAt") '
+                 f'FROM sync_items {where} GROUP BY grp ORDER BY COUNT(*) DESC, grp')
+        return self.conn.execute(query, params).fetchall()
+
+
+def run_store_query(argv: List[str]) -> None:
+    """Answer count questions from a local SQLite store without calling the API."""
+    parser = argparse.ArgumentParser(
+        prog="query_sync_items_with_status.py query",
+        description="Query a local SQLite store written with --sqlite (no API access needed)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Errors by source in the last 7 days
+  python query_sync_items_with_status.py query --db sync_items.db --status ERROR --group-by source --days 7
+  
+  # Items per day for one month
+  python query_sync_items_with_status.py query --db sync_items.db --group-by day --start-date 2024-01-01 --end-date 2024-01-31
+        """
+    )
+    parser.add_argument("--db", required=True, help="SQLite database written with --sqlite")
+    parser.add_argument("--status", help="Filter by status (OK, WARNING, ERROR, INFO)")
+    parser.add_argument("--group-by", default="source", choices=SyncItemStore.INDEXED_COLUMNS + ["day"],
+                        help="Column to group counts by (default: source)")
+    parser.add_argument("--days", type=int, help="Only count items created in the last N days")
+    parser.add_argument("--start-date", help="Only count items created on or after this date (ISO format, UTC if no offset)")
+    parser.add_argument("--end-date", help="Only count items created on or before this date (ISO format, UTC if no offset)")
+    args = parser.parse_args(argv)
+    
+    if not os.path.exists(args.db):
+        parser.error(f"database not found: {args.db}")
+    
+    def parse_bound(value: Optional[str]) -> Optional[datetime]:
+        if not value:
+            return None
+        try:
+            parsed = parse_iso_datetime(value)
+        except ValueError:
+            parser.error(f"invalid date: {value}")
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    
+    since = parse_bound(args.start_date)
+    until = parse_bound(args.end_date)
+    if args.days:
+        since = datetime.now(timezone.utc) - timedelta(days=args.days)
+    
+    with SyncItemStore(args.db) as store:
+        rows = store.count_by(args.group_by, status=args.status, since=since, until=until)
+    
+    title = f"Items by {args.group_by}"
+    if args.status:
+        title += f" (status = {args.status.upper()})"
+    if args.days:
+        title += f", last {args.days} days"
+    print("\n" + "="*80)
+    print(title)
+    print("="*80)
+    if not rows:
+        print("No items found.")
+        return
+    width = max(len(str(row[0])) for row in rows)
+    print(f"{'Value':<{width}}  {'Count':>8}  {'First seen':<27}  {'Last seen':<27}")
+    for value, count, first_seen, last_seen in rows:
+        print(f"{str(value):<{width}}  {count:>8}  {first_seen or '':<27}  {last_seen or '':<27}")
+    print(f"\nTotal: {sum(row[1] for row in rows)}")
+
+
+def load_workspaces(path: str, default_region: Optional[str] = None) -> List[Dict[str, str]]:
+    """Read the workspace list for --workspaces.
+
+    The file holds a JSON list of objects with `workspace_id`, and optionally `name`,
+    `region` (defaults to --region) and either `api_token_env` (name of an environment
+    variable holding the token, preferred) or `api_token`.
+    """
+    with open(path) as f:
+        entries = json.load(f)
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{path} must contain a non-empty JSON list of workspaces")
+    
+    workspaces = []
+    for index, entry in enumerate(entries, 1):
+        workspace_id = entry.get("workspace_id")
+        if not workspace_id:
+            raise ValueError(f"workspace #{index} in {path} has no workspace_id")
+        api_token = entry.get("api_token")
+        if entry.get("api_token_env"):
+            api_token = os.getenv(entry["api_token_env"])
+        if not api_token:
+            raise ValueError(f"workspace #{index} in {path} has no API token (set api_token_env or api_token)")
+        region = entry.get("region") or default_region
+        if not region:
+            raise ValueError(f"workspace #{index} in {path} has no region and no --region was given")
+        name = entry.get("name") or workspace_id
+        workspaces.append({"name": name, "workspace_id": workspace_id, "region": region, "api_token": api_token})
+    
+    names = [workspace["name"] for workspace in workspaces]
+    if len(set(names)) != len(names):
+        raise ValueError(f"workspace names in {path} must be unique (they are used in output file names)")
+    return workspaces
+
+
+def workspace_filename(path: str, name: str) -> str:
+    """Insert a workspace name before the file extension(s): out.ndjson.gz -> out_prod.ndjson.gz."""
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+    directory, base = os.path.split(path)
+    stem, dot, extension = base.partition(".")
+    return os.path.join(directory, f"{stem}_{safe_name}{dot}{extension}")
+
+
+async def harvest_workspace(workspace: Dict[str, str], args: argparse.Namespace, http_client: httpx.AsyncClient,
+                            start_date: Optional[datetime], end_date: Optional[datetime],
+                            date_range_defaulted: bool, store: Optional["SyncItemStore"],
+                            stats: Optional[RequestStats] = None) -> Dict[str, Any]:
+    """Stream one workspace's items into its own files and the shared SQLite store."""
+    name = workspace["name"]
+    workspace_id = workspace["workspace_id"]
+    high_water_mark = HighWaterMark(args.state_file, workspace_id, args.status) if args.incremental else None
+    
+    default_output = (not args.output and not args.excel and not args.sqlite and not args.ndjson
+                      and not args.parquet)
+    status_suffix = f"_{args.status.lower()}" if args.status else "_all"
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    excel_filename = workspace_filename(args.excel, name) if args.excel else None
+    json_filename = workspace_filename(args.output, name) if args.output else None
+    if default_output:
+        if EXCEL_AVAILABLE:
+            excel_filename = f"leanix_sync_items_{name}{status_suffix}_{timestamp}.xlsx"
+        else:
+            json_filename = f"leanix_sync_items_{name}{status_suffix}_{timestamp}.json"
+    
+    error_clusters = ErrorClusters() if args.error_clusters else None
+    excel_writer = None
+    if excel_filename and EXCEL_AVAILABLE:
+        excel_writer = StreamingExcelWriter(excel_filename, args.status, start_date, end_date, date_range_defaulted,
+                                            error_clusters=error_clusters, cluster_limit=args.error_clusters)
+    ndjson_writer = None
+    parquet_writer = None
+    counts = ItemCounts()
+    items = []
+    saved_files = []
+    try:
+        if args.ndjson:
+            ndjson_writer = NdjsonWriter(workspace_filename(args.ndjson, name), compress=args.gzip,
+                                         append=args.incremental)
+        if args.parquet:
+            parquet_writer = ParquetWriter(workspace_filename(args.parquet, name))
+        
+        async with LeanIXSyncItemsClient(workspace["api_token"], workspace["region"], workspace_id,
+                                         max_connections=max(10, args.concurrency), max_rate=args.max_rps,
+                                         http_client=http_client, stats=stats, fields=args.fields) as client:
+            item_stream = client.stream_sync_items(
+                status=args.status,
+                batch_limit=args.batch_size,
+                start_date=start_date,
+                end_date=end_date,
+                concurrency=args.concurrency,
+                high_water_mark=high_water_mark,
+                seek=not args.no_seek
+            )
+            try:
+                async for item in item_stream:
+                    # Items from several workspaces end up side by side in the combined store
+                    item.setdefault("workspaceId", workspace_id)
+                    counts.add(item)
+                    if error_clusters is not None:
+                        error_clusters.add(item)
+                    if json_filename:
+                        items.append(item)
+                    if excel_writer:
+                        excel_writer.add(item)
+                    if ndjson_writer:
+                        ndjson_writer.write(item)
+                    if parquet_writer:
+                        parquet_writer.write(item)
+                    if store:
+                        store.add(item)
+                    
+                    if args.limit and counts.total >= args.limit:
+                        break
+            finally:
+                await item_stream.aclose()
+        
+        if ndjson_writer:
+            ndjson_writer.close()
+            saved_files.append(ndjson_writer.filename)
+        if parquet_writer:
+            parquet_writer.close()
+            saved_files.append(parquet_writer.filename)
+        if json_filename and (args.output or counts.total):
+            save_to_file(items, json_filename, args.status)
+            saved_files.append(json_filename)
+        if excel_writer and (args.excel or counts.total):
+            excel_writer.close()
+            saved_files.append(excel_writer.filename)
+        
+        if high_water_mark:
+            high_water_mark.save()
+    finally:
+        if ndjson_writer:
+            ndjson_writer.close()
+        if parquet_writer:
+            parquet_writer.close()
+    
+    return {"name": name, "counts": counts, "files": saved_files, "error_clusters": error_clusters}
+
+
+async def run_workspaces(workspaces: List[Dict[str, str]], args: argparse.Namespace,
+                         start_date: Optional[datetime], end_date: Optional[datetime],
+                         date_range_defaulted: bool, stats: Optional[RequestStats] = None) -> bool:
+    """Harvest every workspace from --workspaces concurrently over one shared connection pool.
+
+    Each workspace gets its own client, so bearer tokens and the adaptive rate limiter
+    (--concurrency, --max-rps) apply per workspace. Returns False if any workspace failed.
+    """
+    per_workspace = max(10, args.concurrency)
+    store = SyncItemStore(args.sqlite) if args.sqlite else None
+    try:
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=per_workspace * len(workspaces) // 2,
+                                max_connections=per_workspace * len(workspaces)),
+        ) as http_client:
+            results = await asyncio.gather(
+                *(harvest_workspace(workspace, args, http_client, start_date, end_date, date_range_defaulted, store,
+                                    stats)
+                  for workspace in workspaces),
+                return_exceptions=True
+            )
+        if store:
+            store.flush()
+    finally:
+        if store:
+            store.close()
+    
+    print("\n" + "="*80)
+    print("WORKSPACE SUMMARY")
+    print("="*80)
+    total = 0
+    failed = False
+    for workspace, result in zip(workspaces, results):
+        if isinstance(result, BaseException):
+            failed = True
+            message = str(result).splitlines()[0] if str(result) else ""
+            print(f"  ✗ {workspace['name']}: {type(result).__name__}: {message}")
+            continue
+        counts = result["counts"]
+        total += counts.total
+        statuses = ", ".join(f"{status} {count}" for status, count in sorted(counts.statuses.items()))
+        print(f"  ✓ {workspace['name']}: {counts.total} items" + (f" ({statuses})" if statuses else ""))
+        for filename in result["files"]:
+            print(f"      💾 {filename}")
+    print(f"\nTotal items: {total}")
+    if store:
+        print(f"🗄  Wrote {store.items_written} items to SQLite database: {args.sqlite}")
+    print("="*80)
+    
+    for workspace, result in zip(workspaces, results):
+        if not isinstance(result, BaseException) and result["error_clusters"] is not None:
+            print_error_clusters(result["error_clusters"], args.error_clusters,
+                                 title=f"MESSAGE CLUSTERS: {workspace['name']}")
+    return not failed
+
+
+def projected_fields(args: argparse.Namespace) -> List[str]:
+    """--fields plus the fields pagination and the requested summaries rely on."""
+    fields = ["id", "createdAt", "status"] + args.fields
+    if args.workspaces:
+        fields.append("workspaceId")
+    if args.error_clusters:
+        fields.extend(ErrorClusters.MESSAGE_FIELDS)
+    if args.rollup:
+        fields.extend([args.rollup, "startedAt", "finishedAt"])
+    return list(dict.fromkeys(fields))
+
+
 async def main():
     """Main function."""
     parser = argparse.ArgumentParser(
@@ -635,6 +2795,25 @@ Examples:
   
   # Stream large datasets to Excel
   python query_sync_items_with_status.py --api-token <YOUR_API_TOKEN> --workspace-id <YOUR_WORKSPACE_ID> --region <YOUR_REGION> --stream --excel large_dataset.xlsx
+  
+  # Resumable export of a large window (re-run the same command after an interruption)
+  python query_sync_items_with_status.py --api-token <YOUR_API_TOKEN> --workspace-id <YOUR_WORKSPACE_ID> --region <YOUR_REGION> --start-date 2024-01-01 --checkpoint export.ckpt
+  
+  # Hourly cron job: only fetch items created since the previous run
+  python query_sync_items_with_status.py --api-token <YOUR_API_TOKEN> --workspace-id <YOUR_WORKSPACE_ID> --region <YOUR_REGION> --incremental --output new_items.json
+  
+  # Stream to gzip-compressed NDJSON for jq/Spark
+  python query_sync_items_with_status.py --api-token <YOUR_API_TOKEN> --workspace-id <YOUR_WORKSPACE_ID> --region <YOUR_REGION> --stream --ndjson items.ndjson --gzip
+  
+  # Crawl a long date range as 6 parallel time slices
+  python query_sync_items_with_status.py --api-token <YOUR_API_TOKEN> --workspace-id <YOUR_WORKSPACE_ID> --region <YOUR_REGION> --start-date 2024-01-01 --end-date 2024-06-30 --shards 6
+  
+  # Harvest into a local SQLite database, then query it offline
+  python query_sync_items_with_status.py --api-token <YOUR_API_TOKEN> --workspace-id <YOUR_WORKSPACE_ID> --region <YOUR_REGION> --sqlite sync_items.db
+  python query_sync_items_with_status.py query --db sync_items.db --status ERROR --group-by source --days 7
+  
+  # Fetch 8 pages in parallel
+  python query_sync_items_with_status.py --api-token <YOUR_API_TOKEN> --workspace-id <YOUR_WORKSPACE_ID> --region <YOUR_REGION> --status ERROR --concurrency 8
 
 Note: All three parameters are mandatory (--api-token, --workspace-id, --region)
       Or set environment variables: LEANIX_API_TOKEN, LEANIX_WORKSPACE_ID, LEANIX_REGION
@@ -644,6 +2823,9 @@ Valid status values: OK, WARNING, ERROR, INFO
         """
     )
     parser.add_argument("--api-token", help="LeanIX API token (or set LEANIX_API_TOKEN env var)")
+    parser.add_argument("--workspaces", metavar="FILE",
+                        help="JSON list of workspaces (region, workspace_id, api_token_env) to harvest concurrently "
+                             "instead of a single --workspace-id")
     parser.add_argument("--workspace-id", help="LeanIX workspace ID (or set LEANIX_WORKSPACE_ID env var)")
     parser.add_argument("--region",  help="LeanIX region/sub-domain from your tenant URL (e.g., eu, demo-eu-2, us-1, orgname)")
     parser.add_argument("--status", help="Filter by status (OK, WARNING, ERROR, INFO)")
@@ -653,10 +2835,54 @@ Valid status values: OK, WARNING, ERROR, INFO
     parser.add_argument("--batch-size", type=int, default=100, help="Items per request (default: 100)")
     parser.add_argument("--output", help="Output JSON file path")
     parser.add_argument("--excel", help="Output Excel file path (.xlsx)")
+    parser.add_argument("--ndjson", help="Output newline-delimited JSON file path, written as items arrive (.gz compresses)")
+    parser.add_argument("--gzip", action="store_true", help="Gzip-compress the --ndjson output")
+    parser.add_argument("--parquet", help="Output Parquet file path, written in row groups as items arrive (requires pyarrow)")
+    parser.add_argument("--sqlite", help="Write items into a local SQLite database (query it later with the 'query' subcommand)")
     parser.add_argument("--stream", action="store_true", help="Stream items to handle large datasets efficiently")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only harvest items newer than the previous run (high-water mark kept in --state-file)")
+    parser.add_argument("--state-file", default="leanix_sync_state.json",
+                        help="State file for --incremental mode (default: leanix_sync_state.json)")
+    parser.add_argument("--checkpoint", help="Checkpoint file to record pagination progress; an interrupted export resumes from it")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Number of pages to fetch in parallel; items are still returned in page order (default: 1)")
+    parser.add_argument("--shards", type=int, default=1,
+                        help="Split the date range into N time slices and crawl them in parallel (default: 1)")
+    parser.add_argument("--shard-buffer", type=int, default=50000,
+                        help="With --stream, items each time slice may buffer ahead of the output (default: 50000)")
+    parser.add_argument("--max-rps", type=float,
+                        help="Cap requests per second across all parallel requests (adapts down on HTTP 429)")
+    parser.add_argument("--split-by-status", action="store_true",
+                        help="Without --status: crawl each status in parallel and merge the results newest first")
+    parser.add_argument("--no-seek", action="store_true",
+                        help="Always paginate from page 1 instead of probing for the page where --end-date starts")
+    parser.add_argument("--follow", action="store_true",
+                        help="Keep polling for new items and write each one as a JSON line to stdout (or --ndjson/--sqlite)")
+    parser.add_argument("--interval", type=float, default=30.0,
+                        help="Seconds between polls in --follow mode (default: 30)")
+    parser.add_argument("--rollup", nargs="?", const="source", metavar="FIELD",
+                        help="Roll items up by FIELD (default: source): durations, daily error rates and trends; "
+                             "adds 'Rollup' Excel sheets (requires pandas)")
+    parser.add_argument("--rollup-csv", metavar="PREFIX",
+                        help="Also write the rollup as PREFIX_summary.csv and PREFIX_daily.csv (implies --rollup)")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="Write every request's timing as a Chrome trace JSON file (chrome://tracing, Perfetto)")
+    parser.add_argument("--error-clusters", type=int, nargs="?", const=50, metavar="N",
+                        help="Group messages into fingerprint clusters and show the top N (default: 50); "
+                             "also adds an 'Error Clusters' Excel sheet")
+    parser.add_argument("--fields", type=lambda value: [field.strip() for field in value.split(",") if field.strip()],
+                        metavar="FIELD,...",
+                        help="Only keep these top-level fields of each item (id, createdAt and status are always "
+                             "kept), stored compactly to cut memory use")
     parser.add_argument("--verbose", action="store_true", help="Show detailed item information")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging (may expose sensitive data)")
     
+    # Offline queries against a local SQLite store
+    if len(sys.argv) > 1 and sys.argv[1] == "query":
+        run_store_query(sys.argv[2:])
+        return
+    
     # Check if no arguments provided at all (just script name)
     if len(sys.argv) == 1:
         parser.print_help()
@@ -664,26 +2890,82 @@ Valid status values: OK, WARNING, ERROR, INFO
     
     args = parser.parse_args()
     
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.max_rps is not None and args.max_rps <= 0:
+        parser.error("--max-rps must be positive")
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+    if args.shard_buffer < 1:
+        parser.error("--shard-buffer must be at least 1")
+    if args.limit and args.incremental:
+        # The mark would move past the items the limit cut off, and later runs would never fetch them
+        parser.error("--limit cannot be combined with --incremental")
+    if args.gzip and not args.ndjson:
+        parser.error("--gzip only applies to --ndjson output")
+    if args.parquet and args.incremental:
+        parser.error("--parquet cannot be combined with --incremental (Parquet files cannot be appended to)")
+    if args.parquet and not PARQUET_AVAILABLE:
+        parser.error("--parquet requires pyarrow. Install with: pip install pyarrow")
+    if args.rollup_csv and not args.rollup:
+        args.rollup = "source"
+    if args.rollup and (args.follow or args.workspaces):
+        parser.error("--rollup cannot be combined with --follow or --workspaces")
+    if args.rollup and not PANDAS_AVAILABLE:
+        parser.error("--rollup requires pandas. Install with: pip install pandas")
+    if args.error_clusters is not None and args.error_clusters < 1:
+        parser.error("--error-clusters must be at least 1")
+    if args.fields is not None:
+        args.fields = projected_fields(args)
+        invalid = [field for field in args.fields if not field.isidentifier()]
+        if invalid:
+            parser.error(f"--fields only accepts top-level field names, not: {', '.join(invalid)}")
+    if args.shards > 1 and (args.checkpoint or args.incremental):
+        parser.error("--shards cannot be combined with --checkpoint or --incremental")
+    if args.split_by_status and (args.status or args.shards > 1 or args.checkpoint or args.incremental):
+        parser.error("--split-by-status cannot be combined with --status, --shards, --checkpoint or --incremental")
+    if args.follow and (args.end_date or args.output or args.excel or args.parquet or args.workspaces
+                        or args.shards > 1 or args.split_by_status or args.checkpoint):
+        parser.error("--follow only writes to stdout, --ndjson or --sqlite and cannot be combined with --end-date, "
+                     "--shards, --split-by-status, --checkpoint or --workspaces")
+    if args.interval < 1:
+        parser.error("--interval must be at least 1 second")
+    if args.workspaces and (args.shards > 1 or args.split_by_status or args.checkpoint):
+        parser.error("--workspaces cannot be combined with --shards, --split-by-status or --checkpoint")
+    
     # Setup logging
     setup_logging(debug=args.debug)
     
+    follow_output = sys.stdout
+    if args.follow and not args.ndjson:
+        # Items go to stdout as JSON lines; keep every other message out of the way on stderr
+        sys.stdout = sys.stderr
+    
     # Validate required parameters
+    workspaces = None
+    if args.workspaces:
+        try:
+            workspaces = load_workspaces(args.workspaces, args.region or os.getenv("LEANIX_REGION"))
+        except (OSError, ValueError) as e:
+            logging.error(f"✗ Error: Invalid workspaces file: {e}")
+            sys.exit(1)
+    
     api_token = args.api_token or os.getenv("LEANIX_API_TOKEN")
-    if not api_token:
+    if not api_token and not workspaces:
         logging.error("✗ Error: API token is required")
         logging.error("   Use --api-token TOKEN or set LEANIX_API_TOKEN environment variable")
         parser.print_help()
         sys.exit(1)
     
     workspace_id = args.workspace_id or os.getenv("LEANIX_WORKSPACE_ID")
-    if not workspace_id:
+    if not workspace_id and not workspaces:
         logging.error("✗ Error: Workspace ID is required")
         logging.error("   Use --workspace-id <YOUR_WORKSPACE_ID> or set LEANIX_WORKSPACE_ID environment variable")
         parser.print_help()
         sys.exit(1)
     
     region = args.region or os.getenv("LEANIX_REGION")
-    if not region:
+    if not region and not workspaces:
         logging.error("✗ Error: Region is required")
         logging.error("   Use --region REGION (e.g., eu, enbridgeca, demo-eu-2, us-1)")
         logging.error("   Or set LEANIX_REGION environment variable")
@@ -742,11 +3024,23 @@ Valid status values: OK, WARNING, ERROR, INFO
             logging.error(f"   Use format: YYYY-MM-DD or ISO datetime")
             sys.exit(1)
     
+    checkpoint = PaginationCheckpoint(args.checkpoint) if args.checkpoint else None
+    
+    # A defaulted window moves with the clock, so reuse the interrupted run's window on resume
+    if checkpoint and date_range_defaulted:
+        saved_query = checkpoint.load().get("query", {})
+        if saved_query.get("start_date") and saved_query.get("end_date"):
+            start_date = parse_iso_datetime(saved_query["start_date"])
+            end_date = parse_iso_datetime(saved_query["end_date"])
+    
     print("="*80)
     print("LeanIX Synchronization Items Query")
     print("="*80)
-    print(f"Region: {region}")
-    print(f"Workspace ID: {workspace_id}")
+    if workspaces:
+        print(f"Workspaces: {len(workspaces)} harvested concurrently ({', '.join(w['name'] for w in workspaces)})")
+    else:
+        print(f"Region: {region}")
+        print(f"Workspace ID: {workspace_id}")
     print(f"Batch size: {args.batch_size}")
     if args.status:
         print(f"Status filter: {args.status.upper()}")
@@ -764,29 +3058,185 @@ Valid status values: OK, WARNING, ERROR, INFO
         print(f"Max items: {args.limit}")
     if args.stream:
         print("Mode: Streaming (memory efficient)")
+    if args.concurrency > 1:
+        print(f"Concurrency: {args.concurrency} pages in flight")
+    if args.shards > 1:
+        print(f"Shards: {args.shards} parallel time slices")
+    if args.split_by_status:
+        print(f"Split by status: {len(LeanIXSyncItemsClient.VALID_STATUSES)} parallel streams")
+    if checkpoint:
+        print(f"Checkpoint: {checkpoint.path}")
+    if args.incremental:
+        print(f"Mode: Incremental (state file: {args.state_file})")
+    if args.follow:
+        print(f"Mode: Follow (polling every {args.interval:g}s)")
+    if args.fields:
+        print(f"Fields: {', '.join(args.fields)}")
     print("="*80)
     
+    stats = RequestStats()
+    if workspaces:
+        try:
+            succeeded = await run_workspaces(workspaces, args, start_date, end_date, date_range_defaulted, stats)
+        except KeyboardInterrupt:
+            print("\n\n⚠ Interrupted by user")
+            sys.exit(1)
+        finally:
+            stats.print_summary()
+            if args.trace:
+                stats.write_trace(args.trace)
+        if not succeeded:
+            sys.exit(1)
+        print("\n✓ Query completed successfully")
+        return
+    
+    store = None
+    ndjson_writer = None
+    parquet_writer = None
     try:
-        async with LeanIXSyncItemsClient(api_token, region, workspace_id) as client:
-            if args.stream:
-                # Stream mode for large datasets
-                items = []
-                item_count = 0
-                async for item in client.stream_sync_items(
+        parallel_streams = len(LeanIXSyncItemsClient.VALID_STATUSES) if args.split_by_status else args.shards
+        max_connections = max(10, args.concurrency * parallel_streams)
+        high_water_mark = HighWaterMark(args.state_file, workspace_id, args.status) if args.incremental else None
+        store = SyncItemStore(args.sqlite) if args.sqlite else None
+        # Incremental runs add their new rows to the end of an existing NDJSON file
+        ndjson_writer = NdjsonWriter(args.ndjson, compress=args.gzip, append=args.incremental) if args.ndjson else None
+        parquet_writer = ParquetWriter(args.parquet) if args.parquet else None
+        
+        # Default Excel export if no output files specified
+        default_output = (not args.output and not args.excel and not args.sqlite and not args.ndjson
+                          and not args.parquet)
+        status_suffix = f"_{args.status.lower()}" if args.status else "_all"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        default_excel_filename = f"leanix_sync_items{status_suffix}_{timestamp}.xlsx"
+        default_json_filename = f"leanix_sync_items{status_suffix}_{timestamp}.json"
+        
+        async with LeanIXSyncItemsClient(api_token, region, workspace_id, max_connections=max_connections,
+                                         max_rate=args.max_rps, stats=stats, fields=args.fields) as client:
+            def parallel_item_stream() -> Optional[AsyncIterator[Dict[str, Any]]]:
+                """Item stream for the parallel crawl modes, or None for plain pagination."""
+                if args.shards > 1:
+                    return client.stream_sync_items_sharded(
+                        status=args.status,
+                        batch_limit=args.batch_size,
+                        start_date=start_date,
+                        end_date=end_date,
+                        shards=args.shards,
+                        concurrency=args.concurrency,
+                        # Only --stream avoids holding every item anyway, so only it bounds the shards
+                        buffer_size=args.shard_buffer if args.stream else None
+                    )
+                if args.split_by_status:
+                    return client.stream_sync_items_by_status(
+                        batch_limit=args.batch_size,
+                        start_date=start_date,
+                        end_date=end_date,
+                        concurrency=args.concurrency,
+                        seek=not args.no_seek
+                    )
+                return None
+            
+            if args.follow:
+                # No date range given means "from now on", not the default 30 day window
+                follow_stream = client.follow_sync_items(
+                    high_water_mark or HighWaterMark(None, workspace_id, args.status),
                     status=args.status,
                     batch_limit=args.batch_size,
-                    start_date=start_date,
-                    end_date=end_date
-                ):
-                    items.append(item)
-                    item_count += 1
-                    
-                    if args.limit and item_count >= args.limit:
-                        break
+                    interval=args.interval,
+                    start_date=None if date_range_defaulted else start_date
+                )
+                followed = 0
+                try:
+                    async for new_items in follow_stream:
+                        if args.limit:
+                            new_items = new_items[:args.limit - followed]
+                        if ndjson_writer:
+                            ndjson_writer.write_items(new_items)
+                            ndjson_writer.flush()
+                        else:
+                            for item in new_items:
+                                follow_output.write(json.dumps(item, separators=(",", ":"), default=json_default) + "\n")
+                            follow_output.flush()
+                        if store:
+                            store.add_items(new_items)
+                            store.flush()
+                        followed += len(new_items)
+                        if args.limit and followed >= args.limit:
+                            break
+                finally:
+                    await follow_stream.aclose()
+                return
+            
+            excel_writer = None
+            error_clusters = ErrorClusters() if args.error_clusters else None
+            rollup = SyncRollup(group_by=args.rollup) if args.rollup else None
+            if args.stream:
+                # Stream mode for large datasets: Excel rows are written as items arrive
+                excel_filename = args.excel or (default_excel_filename if default_output else None)
+                if excel_filename and EXCEL_AVAILABLE:
+                    excel_writer = StreamingExcelWriter(excel_filename, args.status, start_date, end_date,
+                                                        date_range_defaulted, error_clusters=error_clusters,
+                                                        cluster_limit=args.error_clusters, rollup=rollup)
+                
+                # Only the JSON export needs every item in memory
+                keep_items = bool(args.output) or (default_output and not EXCEL_AVAILABLE)
+                items = []
+                counts = ItemCounts()
+                item_stream = parallel_item_stream()
+                if item_stream is None:
+                    item_stream = client.stream_sync_items(
+                        status=args.status,
+                        batch_limit=args.batch_size,
+                        start_date=start_date,
+                        end_date=end_date,
+                        concurrency=args.concurrency,
+                        checkpoint=checkpoint,
+                        high_water_mark=high_water_mark,
+                        seek=not args.no_seek
+                    )
+                try:
+                    async for item in item_stream:
+                        counts.add(item)
+                        if error_clusters is not None:
+                            error_clusters.add(item)
+                        if rollup is not None:
+                            rollup.add(item)
+                        if keep_items or len(items) < 3:
+                            items.append(item)
+                        if excel_writer:
+                            excel_writer.add(item)
+                        if ndjson_writer:
+                            ndjson_writer.write(item)
+                        if parquet_writer:
+                            parquet_writer.write(item)
+                        if store:
+                            store.add(item)
                         
-                    # For streaming mode with output, collect items but log progress
-                    if item_count % 1000 == 0:
-                        logging.info(f"Streamed {item_count} items...")
+                        if args.limit and counts.total >= args.limit:
+                            break
+                            
+                        # For streaming mode with output, collect items but log progress
+                        if counts.total % 1000 == 0:
+                            logging.info(f"Streamed {counts.total} items...")
+                finally:
+                    await item_stream.aclose()
+            elif args.shards > 1 or args.split_by_status:
+                # Parallel time shards or status streams, merged back into newest-first order
+                items = []
+                item_stream = parallel_item_stream()
+                try:
+                    async for item in item_stream:
+                        items.append(item)
+                        if args.limit and len(items) >= args.limit:
+                            break
+                finally:
+                    await item_stream.aclose()
+                counts = ItemCounts.from_items(items)
+                if store:
+                    store.add_items(items)
+                if ndjson_writer:
+                    ndjson_writer.write_items(items)
+                if parquet_writer:
+                    parquet_writer.write_items(items)
             else:
                 # Standard mode
                 items = await client.get_all_sync_items(
@@ -794,38 +3244,77 @@ Valid status values: OK, WARNING, ERROR, INFO
                     batch_limit=args.batch_size,
                     max_items=args.limit,
                     start_date=start_date,
-                    end_date=end_date
+                    end_date=end_date,
+                    concurrency=args.concurrency,
+                    checkpoint=checkpoint,
+                    high_water_mark=high_water_mark,
+                    seek=not args.no_seek
                 )
+                counts = ItemCounts.from_items(items)
+                if store:
+                    store.add_items(items)
+                if ndjson_writer:
+                    ndjson_writer.write_items(items)
+                if parquet_writer:
+                    parquet_writer.write_items(items)
+            
+            if error_clusters is not None and not args.stream:
+                error_clusters = ErrorClusters.from_items(items)
+            if rollup is not None and not args.stream:
+                rollup = SyncRollup.from_items(items, group_by=args.rollup)
             
-            print_summary(items, args.status)
+            print_counts_summary(counts, args.status)
+            if error_clusters is not None:
+                print_error_clusters(error_clusters, args.error_clusters)
+            if rollup is not None:
+                print_rollup(rollup)
             
             # Handle output options - Excel is default
             saved_files = []
             
+            if store:
+                store.flush()
+                print(f"\n🗄  Wrote {store.items_written} items to SQLite database: {args.sqlite}")
+                saved_files.append(args.sqlite)
+            
+            if ndjson_writer:
+                ndjson_writer.close()
+                print(f"\n💾 Wrote {ndjson_writer.items_written} items to NDJSON file: {ndjson_writer.filename}")
+                saved_files.append(ndjson_writer.filename)
+            
+            if parquet_writer:
+                parquet_writer.close()
+                print(f"\n💾 Wrote {parquet_writer.items_written} items to Parquet file: {parquet_writer.filename}")
+                saved_files.append(parquet_writer.filename)
+            
             if args.output:
                 save_to_file(items, args.output, args.status)
                 saved_files.append(args.output)
             
-            if args.excel:
+            if args.rollup_csv:
+                rollup_files = rollup.write_csv(args.rollup_csv)
+                print(f"\n📈 Wrote rollup to {', '.join(rollup_files)}")
+                saved_files.extend(rollup_files)
+            
+            if excel_writer:
+                # An explicitly requested file is always written, the default one only when there is data
+                if args.excel or counts.total:
+                    excel_writer.close()
+                    saved_files.append(excel_writer.filename)
+            elif args.excel:
                 if not EXCEL_AVAILABLE:
                     logging.error("Excel export requires openpyxl. Install with: pip install openpyxl")
                 else:
-                    save_to_excel(items, args.excel, args.status, start_date, end_date, date_range_defaulted)
+                    save_to_excel(items, args.excel, args.status, start_date, end_date, date_range_defaulted,
+                                  error_clusters, args.error_clusters, rollup)
                     saved_files.append(args.excel)
-            
-            # Default Excel export if no output files specified
-            if not args.output and not args.excel and items:
-                # Generate default filename
-                status_suffix = f"_{args.status.lower()}" if args.status else "_all"
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                default_excel_filename = f"leanix_sync_items{status_suffix}_{timestamp}.xlsx"
-                
+            elif default_output and counts.total:
                 if EXCEL_AVAILABLE:
-                    save_to_excel(items, default_excel_filename, args.status, start_date, end_date, date_range_defaulted)
+                    save_to_excel(items, default_excel_filename, args.status, start_date, end_date,
+                                  date_range_defaulted, error_clusters, args.error_clusters, rollup)
                     saved_files.append(default_excel_filename)
                 else:
                     # Fallback to JSON if Excel not available
-                    default_json_filename = f"leanix_sync_items{status_suffix}_{timestamp}.json"
                     save_to_file(items, default_json_filename, args.status)
                     saved_files.append(default_json_filename)
                     print("ℹ️  Note: Install openpyxl for Excel export (pip install openpyxl)")
@@ -837,18 +3326,32 @@ Valid status values: OK, WARNING, ERROR, INFO
                 print("="*80)
                 for i, item in enumerate(items[:3], 1):
                     print(f"\nItem {i}:")
-                    print(json.dumps(item, indent=2))
+                    print(json.dumps(item, indent=2, default=json_default))
+            
+            # The export is complete, so there is nothing left to resume
+            if checkpoint:
+                checkpoint.clear()
+            
+            # Only advance the mark once the new items have been written out
+            if high_water_mark:
+                high_water_mark.save()
             
             print("\n✓ Query completed successfully")
         
     except KeyboardInterrupt:
         print("\n\n⚠ Interrupted by user")
+        if checkpoint and checkpoint.exists():
+            print(f"   Re-run with --checkpoint {checkpoint.path} to resume")
         sys.exit(1)
     except httpx.HTTPStatusError as e:
         logging.error(f"\n✗ HTTP Error {e.response.status_code}: {e.response.reason_phrase}")
+        if checkpoint and checkpoint.exists():
+            logging.error(f"   Re-run with --checkpoint {checkpoint.path} to resume")
         sys.exit(1)
     except httpx.RequestError as e:
         logging.error(f"\n✗ Connection Error: {type(e).__name__}: {e}")
+        if checkpoint and checkpoint.exists():
+            logging.error(f"   Re-run with --checkpoint {checkpoint.path} to resume")
         sys.exit(1)
     except ValueError as e:
         logging.error(f"\n✗ Configuration Error: {e}")
@@ -859,6 +3362,16 @@ Valid status values: OK, WARNING, ERROR, INFO
             import traceback
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        if store:
+            store.close()
+        if ndjson_writer:
+            ndjson_writer.close()
+        if parquet_writer:
+            parquet_writer.close()
+        stats.print_summary()
+        if args.trace:
+            stats.write_trace(args.trace)
 
 
 if __name__ == "__main__":